@@ -7,7 +7,9 @@ Endpoints:
 - GET  /rates               - Get all current rates from oracle
 - GET  /rates/{rate_type}   - Get specific rate
 - GET  /rates/{rate_type}/history - Get rate history from SQLite
-- POST /sync                - Manual sync trigger
+- GET  /rates/{rate_type}/history.ndjson - Stream rate history as NDJSON
+- POST /sync                - Manual sync trigger (runs in background)
+- GET  /sync/{job_id}       - Background sync job status
 - GET  /scheduler/jobs      - View scheduled jobs
 - GET  /scheduler/runs      - View recent job runs
 - GET  /bcb/latest/{rate_type} - Direct BCB fetch (bypass oracle)
@@ -22,23 +24,33 @@ Usage:
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, List
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, List
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request, Response
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
+import orjson
 
-from bcb_client import BCBClient, RateType, RATE_CONFIGS, BCBClientError
+from bcb_client import (
+    BCBClient, RateType, BCBClientError, SOURCE_BY_RATE, HEARTBEAT_BY_RATE
+)
 from oracle_updater import OracleUpdater
 from services.data_store import DataStore
+from services.response_cache import ResponseCache
 from scheduler import RateScheduler
-from config import Settings
+from config import get_settings
 from logging_config import setup_logging, get_logger
 
 logger = get_logger(__name__)
 
+API_VERSION = "1.0.0"
+
 
 # =============================================================================
 # PYDANTIC MODELS
@@ -70,7 +82,7 @@ class HealthResponse(BaseModel):
     oracle_connection: bool
     scheduler_running: bool
     last_update: Optional[str] = None
-    version: str = "1.0.0"
+    version: str = API_VERSION
 
 
 class SyncResponse(BaseModel):
@@ -82,6 +94,22 @@ class SyncResponse(BaseModel):
     anomalies_detected: int = 0
     tx_hash: Optional[str] = None
     error: Optional[str] = None
+    job_id: Optional[int] = Field(default=None, description="Background sync job ID (poll /sync/{job_id})")
+
+
+class SyncJobResponse(BaseModel):
+    """Response model for a background sync job."""
+    id: int
+    rate_types: List[str]
+    status: str
+    created_at: str
+    completed_at: Optional[str]
+    rates_updated: int
+    rates_skipped: int
+    rates_failed: int
+    anomalies_detected: int
+    tx_hash: Optional[str]
+    error: Optional[str]
 
 
 class JobResponse(BaseModel):
@@ -92,6 +120,12 @@ class JobResponse(BaseModel):
     trigger: str
 
 
+class RunningJobResponse(BaseModel):
+    """Response model for an in-progress scheduler run."""
+    job_id: str
+    started_at: str
+
+
 class SchedulerRunResponse(BaseModel):
     """Response model for scheduler run."""
     id: int
@@ -130,9 +164,29 @@ class StatsResponse(BaseModel):
 # APP SETUP
 # =============================================================================
 
-settings = Settings()
+settings = get_settings()
 data_store = DataStore(settings.database_path)
-scheduler = RateScheduler(settings, data_store)
+response_cache = ResponseCache()
+# Scheduled and manual updates both drop cached responses once rates change
+scheduler = RateScheduler(settings, data_store, on_rates_updated=response_cache.clear)
+
+# Settings read outside the lifespan, resolved once at import
+API_HOST, API_PORT, API_WORKERS = settings.api_host, settings.api_port, settings.api_workers
+# "*" takes CORSMiddleware's allow-all fast path instead of a per-request origin scan
+CORS_ORIGINS = (
+    ("*",) if settings.cors_origins.strip() == "*"
+    else tuple(origin.strip() for origin in settings.cors_origins.split(",") if origin.strip())
+)
+
+# Response cache TTLs (seconds). On-chain rates change at most once per
+# scheduler run; history only changes when new rates are stored.
+RATES_CACHE_TTL = 60
+RATES_CACHE_CONTROL = f"public, max-age={RATES_CACHE_TTL}"
+RATE_CACHE_TTL = 300
+HISTORY_CACHE_TTL = 3600
+
+# Window growth factor for streamed history scans (1d, 3d, 9d, 27d, ...)
+HISTORY_STREAM_WINDOW_GROWTH = 3
 
 
 @asynccontextmanager
@@ -143,56 +197,108 @@ async def lifespan(app: FastAPI):
         json_format=settings.log_json_format
     )
     await data_store.initialize()
+    # Shared BCB client: one connection pool for the process lifetime
+    app.state.bcb = BCBClient(
+        timeout=settings.bcb_api_timeout,
+        max_retries=settings.bcb_max_retries,
+        retry_base_delay=settings.bcb_retry_base_delay,
+        retry_max_delay=settings.bcb_retry_max_delay
+    )
+    await app.state.bcb.__aenter__()
+    # Shared oracle updater: one RPC provider session for the process lifetime,
+    # reusing the shared BCB client
+    try:
+        app.state.updater = OracleUpdater(bcb=app.state.bcb)
+    except (ValueError, FileNotFoundError) as e:
+        logger.warning(f"Oracle updater unavailable: {e}")
+        app.state.updater = None
+    else:
+        await app.state.updater.__aenter__()
     await scheduler.start()
     logger.info("API started")
     yield
     await scheduler.stop()
+    if app.state.updater is not None:
+        await app.state.updater.close()
+    await app.state.bcb.close()
+    await data_store.close()
     logger.info("API stopped")
 
 
 app = FastAPI(
     title="DELOS API",
     description="Brazilian Macro Data Oracle API - Chainlink-compatible BCB rate feeds",
-    version="1.0.0",
+    version=API_VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # CORS middleware
-cors_origins = settings.cors_origins.split(",") if settings.cors_origins != "*" else ["*"]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=cors_origins,
+    allow_origins=list(CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+_RATE_LOOKUP = {r.value: r for r in RateType}
+_INVALID_RATE_DETAIL = f"Invalid rate type. Valid types: {[r.value for r in RateType]}"
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Keep the documented 400 for an unknown rate_type path parameter (422 otherwise)."""
+    if any(tuple(error.get("loc", ())) == ("path", "rate_type") for error in exc.errors()):
+        return ORJSONResponse({"detail": _INVALID_RATE_DETAIL}, status_code=400)
+    return await request_validation_exception_handler(request, exc)
+
+
+def parse_rate_type(rate_type: str) -> RateType:
+    """Resolve a case-insensitive rate type path/query value, or 400 if unknown."""
+    rate_enum = _RATE_LOOKUP.get(rate_type.upper())
+    if rate_enum is None:
+        raise HTTPException(status_code=400, detail=_INVALID_RATE_DETAIL)
+    return rate_enum
+
+
+def get_updater(request: Request) -> OracleUpdater:
+    """Return the shared OracleUpdater, or 503 if the oracle is not configured."""
+    updater = request.app.state.updater
+    if updater is None:
+        raise HTTPException(status_code=503, detail="Oracle updater not configured")
+    return updater
+
+
 # =============================================================================
 # HEALTH ENDPOINT
 # =============================================================================
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """
     Check system health.
 
     Returns status of BCB API, oracle connection, and scheduler.
     """
-    bcb_ok = False
-    oracle_ok = False
-
-    try:
-        async with BCBClient() as bcb:
-            bcb_ok = await bcb.health_check()
-    except Exception as e:
-        logger.warning(f"BCB health check failed: {e}")
+    async def check_oracle() -> bool:
+        updater = request.app.state.updater
+        return updater is not None and await updater.check_connection()
+
+    # Probe BCB and the oracle concurrently: latency is max(a, b), not a + b
+    bcb_ok, oracle_ok = await asyncio.gather(
+        request.app.state.bcb.health_check(),
+        check_oracle(),
+        return_exceptions=True
+    )
 
-    try:
-        updater = OracleUpdater()
-        oracle_ok = await updater.check_connection()
-    except Exception as e:
-        logger.warning(f"Oracle health check failed: {e}")
+    if isinstance(bcb_ok, Exception):
+        logger.warning(f"BCB health check failed: {bcb_ok}")
+        bcb_ok = False
+    if isinstance(oracle_ok, Exception):
+        logger.warning(f"Oracle health check failed: {oracle_ok}")
+        oracle_ok = False
 
     # Determine overall status
     if bcb_ok and oracle_ok and scheduler.is_running:
@@ -202,104 +308,111 @@ async def health_check():
     else:
         status = "unhealthy"
 
-    return HealthResponse(
-        status=status,
-        bcb_api=bcb_ok,
-        oracle_connection=oracle_ok,
-        scheduler_running=scheduler.is_running,
-        last_update=None  # Could fetch from data_store
-    )
+    # Returned as a Response so FastAPI skips re-validating against HealthResponse
+    return ORJSONResponse({
+        "status": status,
+        "bcb_api": bcb_ok,
+        "oracle_connection": oracle_ok,
+        "scheduler_running": scheduler.is_running,
+        "last_update": None,  # Could fetch from data_store
+        "version": API_VERSION,
+    })
 
 
 # =============================================================================
 # RATE ENDPOINTS
 # =============================================================================
 
+def _rate_item(rate_type: RateType, data: Dict, now_ts: float) -> Dict:
+    """Build a RateResponse dict from an on-chain read, with staleness as of now_ts."""
+    heartbeat_seconds = HEARTBEAT_BY_RATE[rate_type]
+    return {
+        "rate_type": rate_type.value,
+        "answer": data["answer"],
+        "raw_value": data["value_percent"],
+        "real_world_date": data["real_world_date"],
+        "timestamp": data["timestamp"],
+        "source": SOURCE_BY_RATE[rate_type],
+        "is_stale": (now_ts - data["timestamp"]) > heartbeat_seconds,
+        "heartbeat_seconds": heartbeat_seconds,
+    }
+
+
+def _conditional_rates_response(request: Request, rates: Dict[str, Dict]) -> Response:
+    """Return 304 if the client already holds this ETag, else the rates as JSON."""
+    now_ts = time.time()
+    result = [_rate_item(_RATE_LOOKUP[rt], data, now_ts) for rt, data in rates.items()]
+    # Newest update plus the stale count: a feed going stale changes the body
+    newest = max((data["timestamp"] for data in rates.values()), default=0)
+    etag = f'W/"{newest}-{sum(item["is_stale"] for item in result)}"'
+    headers = {"ETag": etag, "Cache-Control": RATES_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    # Returned as a Response so FastAPI skips re-validating against RateResponse
+    return ORJSONResponse(result, headers=headers)
+
+
 @app.get("/rates", response_model=List[RateResponse], tags=["Rates"])
-async def get_all_rates():
+async def get_all_rates(request: Request):
     """
     Get all current rates from the oracle contract.
 
     Returns rates currently stored on-chain with staleness indicators.
+    Supports conditional GET: the weak ETag is the newest on-chain update
+    timestamp plus the number of stale rates, so clients sending a
+    matching If-None-Match get a 304.
     """
+    # Only the on-chain reads are cached; staleness is evaluated per request
+    cached = response_cache.get("rates", "all")
+    if cached is not None:
+        return _conditional_rates_response(request, cached)
+
     try:
-        updater = OracleUpdater()
+        updater = get_updater(request)
         rates = await updater.get_all_current_rates()
-
-        result = []
-        for rate_type_str, data in rates.items():
-            rate_type = RateType(rate_type_str)
-            config = RATE_CONFIGS[rate_type]
-
-            last_update = datetime.fromtimestamp(data["timestamp"])
-            age_seconds = (datetime.now() - last_update).total_seconds()
-            is_stale = age_seconds > config.heartbeat_seconds
-
-            result.append(RateResponse(
-                rate_type=rate_type_str,
-                answer=data["answer"],
-                raw_value=data["value_percent"],
-                real_world_date=data["real_world_date"],
-                timestamp=data["timestamp"],
-                source=f"BCB-{config.bcb_series}",
-                is_stale=is_stale,
-                heartbeat_seconds=config.heartbeat_seconds
-            ))
-
-        return result
+        if rates:
+            # An empty oracle (e.g. before the first sync) is re-read next time
+            response_cache.set("rates", "all", rates, RATES_CACHE_TTL)
+        return _conditional_rates_response(request, rates)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get rates: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/rates/{rate_type}", response_model=RateResponse, tags=["Rates"])
-async def get_rate(rate_type: str):
+async def get_rate(rate_type: RateType, request: Request):
     """
     Get a specific rate from the oracle contract.
 
     Args:
         rate_type: Rate type (IPCA, CDI, SELIC, PTAX, IGPM, TR)
     """
-    try:
-        rate_enum = RateType(rate_type.upper())
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid rate type. Valid types: {[r.value for r in RateType]}"
-        )
+    # Only the on-chain read is cached; staleness is evaluated per request
+    data = response_cache.get("rate", rate_type)
+    if data is not None:
+        return RateResponse(**_rate_item(rate_type, data, time.time()))
 
     try:
-        updater = OracleUpdater()
-        data = await updater.get_current_rate(rate_enum.value)
+        updater = get_updater(request)
+        data = await updater.get_current_rate(rate_type.value)
 
         if data is None:
-            raise HTTPException(status_code=404, detail=f"Rate {rate_type} not found in oracle")
-
-        config = RATE_CONFIGS[rate_enum]
-        last_update = datetime.fromtimestamp(data["timestamp"])
-        age_seconds = (datetime.now() - last_update).total_seconds()
-        is_stale = age_seconds > config.heartbeat_seconds
-
-        return RateResponse(
-            rate_type=rate_type.upper(),
-            answer=data["answer"],
-            raw_value=data["value_percent"],
-            real_world_date=data["real_world_date"],
-            timestamp=data["timestamp"],
-            source=f"BCB-{config.bcb_series}",
-            is_stale=is_stale,
-            heartbeat_seconds=config.heartbeat_seconds
-        )
+            raise HTTPException(status_code=404, detail=f"Rate {rate_type.value} not found in oracle")
+
+        response_cache.set("rate", rate_type, data, RATE_CACHE_TTL)
+        return RateResponse(**_rate_item(rate_type, data, time.time()))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get rate {rate_type}: {e}", exc_info=True)
+        logger.error(f"Failed to get rate {rate_type.value}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/rates/{rate_type}/history", response_model=RateHistoryResponse, tags=["Rates"])
 async def get_rate_history(
-    rate_type: str,
+    rate_type: RateType,
     days: int = Query(default=30, ge=1, le=365, description="Number of days of history")
 ):
     """
@@ -309,45 +422,99 @@ async def get_rate_history(
         rate_type: Rate type (IPCA, CDI, SELIC, PTAX, IGPM, TR)
         days: Number of days of history (1-365)
     """
-    try:
-        rate_enum = RateType(rate_type.upper())
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid rate type. Valid types: {[r.value for r in RateType]}"
-        )
+    cached = response_cache.get("history", (rate_type, days))
+    if cached is not None:
+        return cached
 
     try:
-        history = await data_store.get_rate_history(rate_enum.value, days)
-        config = RATE_CONFIGS[rate_enum]
+        rows = await data_store.get_rate_history_rows(rate_type.value, days)
+        heartbeat_seconds = HEARTBEAT_BY_RATE[rate_type]
 
-        return RateHistoryResponse(
-            rate_type=rate_type.upper(),
+        response = RateHistoryResponse(
+            rate_type=rate_type.value,
             history=[
-                RateResponse(
-                    rate_type=rate_type.upper(),
-                    answer=r.answer,
-                    raw_value=r.raw_value,
-                    real_world_date=r.real_world_date,
-                    timestamp=int(r.bcb_timestamp.timestamp()),
-                    source=r.source,
+                RateResponse.model_construct(
+                    rate_type=rate_type.value,
+                    answer=answer,
+                    raw_value=raw_value,
+                    real_world_date=real_world_date,
+                    timestamp=int(datetime.fromisoformat(bcb_timestamp).timestamp()),
+                    source=source,
                     is_stale=False,
-                    heartbeat_seconds=config.heartbeat_seconds
+                    heartbeat_seconds=heartbeat_seconds
                 )
-                for r in history
+                for answer, raw_value, real_world_date, bcb_timestamp, source in rows
             ],
-            count=len(history)
+            count=len(rows)
         )
+        response_cache.set("history", (rate_type, days), response, HISTORY_CACHE_TTL)
+        return response
     except Exception as e:
-        logger.error(f"Failed to get history for {rate_type}: {e}", exc_info=True)
+        logger.error(f"Failed to get history for {rate_type.value}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/rates/{rate_type}/history.ndjson", tags=["Rates"])
+async def stream_rate_history(
+    rate_type: RateType,
+    days: int = Query(default=30, ge=1, le=365, description="Number of days of history")
+):
+    """
+    Stream historical rates as newline-delimited JSON.
+
+    Scans storage in expanding time windows (1 day, then 3, 9, ... days back)
+    so the first rows are sent before the whole range has been read. If
+    storage fails mid-stream, a final {"error": ...} line marks the stream
+    as truncated (the 200 status has already been sent).
+
+    Args:
+        rate_type: Rate type (IPCA, CDI, SELIC, PTAX, IGPM, TR)
+        days: Number of days of history (1-365)
+    """
+    heartbeat_seconds = HEARTBEAT_BY_RATE[rate_type]
+
+    async def generate():
+        end = datetime.now()
+        covered = 0
+        window = 1
+        try:
+            while covered < days:
+                size = min(window, days - covered)
+                start = end - timedelta(days=size)
+                rows = await data_store.get_rate_history_range(rate_type.value, start, end)
+                for answer, raw_value, real_world_date, bcb_timestamp, source in rows:
+                    yield orjson.dumps({
+                        "rate_type": rate_type.value,
+                        "answer": answer,
+                        "raw_value": raw_value,
+                        "real_world_date": real_world_date,
+                        "timestamp": int(datetime.fromisoformat(bcb_timestamp).timestamp()),
+                        "source": source,
+                        "is_stale": False,
+                        "heartbeat_seconds": heartbeat_seconds,
+                    }) + b"\n"
+                covered += size
+                end = start
+                window *= HISTORY_STREAM_WINDOW_GROWTH
+        except Exception as e:
+            # Headers are already sent; a terminal error line signals the failure
+            logger.error(f"History stream failed for {rate_type.value}: {e}", exc_info=True)
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 # =============================================================================
 # SYNC ENDPOINT
 # =============================================================================
 
-@app.post("/sync", response_model=SyncResponse, tags=["Sync"])
+async def run_manual_sync(rate_types: List[RateType], job_id: int) -> None:
+    """Background task: run a manual sync and record it on its sync job."""
+    # Cached responses are dropped by the scheduler's on_rates_updated hook
+    await scheduler._update_rates_and_record(rate_types, "manual", job_id)
+
+
+@app.post("/sync", response_model=SyncResponse, status_code=202, tags=["Sync"])
 async def manual_sync(
     background_tasks: BackgroundTasks,
     rate_type: Optional[str] = Query(default=None, description="Specific rate to sync (optional)"),
@@ -356,34 +523,26 @@ async def manual_sync(
     """
     Manually trigger rate synchronization.
 
+    The sync runs in the background; poll /sync/{job_id} for the outcome.
+
     Args:
         rate_type: Specific rate to sync (optional, default: all)
         force: Force update even if same date
     """
     try:
         if rate_type:
-            try:
-                rate_enum = RateType(rate_type.upper())
-                rate_types = [rate_enum]
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid rate type. Valid types: {[r.value for r in RateType]}"
-                )
+            rate_types = [parse_rate_type(rate_type)]
         else:
             rate_types = list(RateType)
 
-        # Run update
-        results = await scheduler._update_rates(rate_types, "manual")
+        job_id = await data_store.create_sync_job([r.value for r in rate_types])
+        background_tasks.add_task(run_manual_sync, rate_types, job_id)
 
         return SyncResponse(
-            success=results["success"],
-            rates_updated=results["rates_updated"],
-            rates_skipped=results["rates_skipped"],
-            rates_failed=results.get("rates_failed", 0),
-            anomalies_detected=results.get("anomalies_detected", 0),
-            tx_hash=results.get("tx_hash"),
-            error=results.get("error")
+            success=True,
+            rates_updated=0,
+            rates_skipped=0,
+            job_id=job_id
         )
     except HTTPException:
         raise
@@ -392,6 +551,28 @@ async def manual_sync(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/sync/{job_id}", response_model=SyncJobResponse, tags=["Sync"])
+async def get_sync_job(job_id: int):
+    """Get the status and outcome of a background sync job."""
+    job = await data_store.get_sync_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Sync job {job_id} not found")
+
+    return SyncJobResponse(
+        id=job.id,
+        rate_types=job.rate_types,
+        status=job.status,
+        created_at=job.created_at.isoformat(),
+        completed_at=job.completed_at.isoformat() if job.completed_at else None,
+        rates_updated=job.rates_updated,
+        rates_skipped=job.rates_skipped,
+        rates_failed=job.rates_failed,
+        anomalies_detected=job.anomalies_detected,
+        tx_hash=job.tx_hash,
+        error=job.error_message
+    )
+
+
 # =============================================================================
 # SCHEDULER ENDPOINTS
 # =============================================================================
@@ -403,6 +584,12 @@ async def get_scheduler_jobs():
     return [JobResponse(**job) for job in jobs]
 
 
+@app.get("/scheduler/running", response_model=List[RunningJobResponse], tags=["Scheduler"])
+async def get_running_jobs():
+    """Get scheduler runs that are in progress (finished runs are in /scheduler/runs)."""
+    return [RunningJobResponse(**run) for run in scheduler.get_running()]
+
+
 @app.get("/scheduler/runs", response_model=List[SchedulerRunResponse], tags=["Scheduler"])
 async def get_scheduler_runs(
     limit: int = Query(default=20, ge=1, le=100, description="Number of runs to return")
@@ -410,7 +597,7 @@ async def get_scheduler_runs(
     """Get recent scheduler job runs."""
     runs = await data_store.get_scheduler_runs(limit)
     return [
-        SchedulerRunResponse(
+        SchedulerRunResponse.model_construct(
             id=r.id,
             job_id=r.job_id,
             started_at=r.started_at.isoformat(),
@@ -429,7 +616,7 @@ async def get_scheduler_runs(
 # =============================================================================
 
 @app.get("/bcb/latest/{rate_type}", tags=["BCB"])
-async def get_bcb_latest(rate_type: str):
+async def get_bcb_latest(rate_type: RateType, request: Request):
     """
     Fetch latest rate directly from BCB API (bypass oracle).
 
@@ -439,31 +626,14 @@ async def get_bcb_latest(rate_type: str):
         rate_type: Rate type (IPCA, CDI, SELIC, PTAX, IGPM, TR)
     """
     try:
-        rate_enum = RateType(rate_type.upper())
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid rate type. Valid types: {[r.value for r in RateType]}"
-        )
-
-    try:
-        async with BCBClient() as bcb:
-            data = await bcb.fetch_latest(rate_enum)
-            return {
-                "rate_type": data.rate_type.value,
-                "answer": data.answer,
-                "raw_value": data.raw_value,
-                "real_world_date": data.real_world_date,
-                "real_world_date_str": data.real_world_date_str,
-                "source": data.source,
-                "description": data.description,
-                "timestamp": data.timestamp.isoformat()
-            }
+        data = await request.app.state.bcb.fetch_latest(rate_type)
+        # orjson serializes the dataclass natively (enum as value, datetime as ISO 8601)
+        return ORJSONResponse(data)
     except BCBClientError as e:
-        logger.error(f"BCB fetch failed for {rate_type}: {e}")
+        logger.error(f"BCB fetch failed for {rate_type.value}: {e}")
         raise HTTPException(status_code=502, detail=f"BCB API error: {str(e)}")
     except Exception as e:
-        logger.error(f"BCB fetch failed for {rate_type}: {e}", exc_info=True)
+        logger.error(f"BCB fetch failed for {rate_type.value}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -480,14 +650,7 @@ async def get_anomalies(
     """Get detected anomalies from the database."""
     try:
         if rate_type:
-            try:
-                RateType(rate_type.upper())
-                rate_type = rate_type.upper()
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid rate type. Valid types: {[r.value for r in RateType]}"
-                )
+            rate_type = parse_rate_type(rate_type).value
 
         anomalies = await data_store.get_anomalies(rate_type, days, limit)
         return [
@@ -533,10 +696,18 @@ async def get_stats():
 def main():
     """Run the API server."""
     import uvicorn
+    if API_WORKERS > 1:
+        logger.warning(
+            f"Starting {API_WORKERS} workers: each runs its own scheduler and response cache"
+        )
+    # "auto" selects uvloop and httptools when installed (uvloop is unavailable on Windows)
     uvicorn.run(
         "api:app",
-        host=settings.api_host,
-        port=settings.api_port,
+        host=API_HOST,
+        port=API_PORT,
+        loop="auto",
+        http="auto",
+        workers=API_WORKERS,
         reload=False,
         log_level="info"
     )
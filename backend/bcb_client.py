@@ -31,11 +31,16 @@ API Documentation: https://dadosabertos.bcb.gov.br/
 
 import asyncio
 import logging
+import random
+import time
+import warnings
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +53,24 @@ logger = logging.getLogger(__name__)
 CHAINLINK_DECIMALS = 8
 CHAINLINK_PRECISION = 10 ** CHAINLINK_DECIMALS  # 100,000,000
 
+# Powers of ten for scaling decimal strings without a float round-trip
+_POW10 = [10 ** i for i in range(CHAINLINK_DECIMALS + 1)]
+
 # ISO 4217: BRL minor unit decimals
 ISO_4217_BRL_DECIMALS = 2
 
+# HTTP connection pool: keep sockets to api.bcb.gov.br alive between requests
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60.0)
+
+# Response cache: BCB series update at most daily, so repeated requests for
+# the same URL within the TTL are served from memory (LRU-bounded)
+RESPONSE_CACHE_TTL = 300.0
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Date ranges longer than this are fetched as concurrent monthly shards
+DATE_RANGE_SHARD_THRESHOLD_DAYS = 365
+MAX_CONCURRENT_SHARDS = 8
+
 
 class RateType(str, Enum):
     """
@@ -66,6 +86,13 @@ class RateType(str, Enum):
     IGPM = "IGPM"      # Inflation: monthly, typically -2% to 3%
     TR = "TR"          # Interest: daily, typically 0% to 5%
 
+    @classmethod
+    def _missing_(cls, value):
+        """Accept rate types case-insensitively (e.g. "cdi" -> RateType.CDI)."""
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.upper())
+        return None
+
 
 @dataclass(frozen=True)
 class RateConfig:
@@ -146,12 +173,20 @@ RATE_CONFIGS: Dict[RateType, RateConfig] = {
     ),
 }
 
+# Per-rate lookups derived from RATE_CONFIGS, for hot paths that build many responses
+SOURCE_BY_RATE: Dict[RateType, str] = {
+    rate_type: f"BCB-{config.bcb_series}" for rate_type, config in RATE_CONFIGS.items()
+}
+HEARTBEAT_BY_RATE: Dict[RateType, int] = {
+    rate_type: config.heartbeat_seconds for rate_type, config in RATE_CONFIGS.items()
+}
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateData:
     """
     Processed rate data ready for on-chain submission.
@@ -285,37 +320,83 @@ class BCBClient:
     """
     
     BASE_URL = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.{series}/dados"
+    WARMUP_URL = "https://api.bcb.gov.br/"
     TIMEOUT = 30.0
     
-    def __init__(self, timeout: float = TIMEOUT, validate: bool = True):
+    def __init__(
+        self,
+        timeout: float = TIMEOUT,
+        validate: bool = True,
+        cache_ttl: float = RESPONSE_CACHE_TTL,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 60.0
+    ):
         """
         Initialize BCB client.
         
         Args:
             timeout: HTTP request timeout in seconds
             validate: Enable circuit breaker validation
+            cache_ttl: Seconds to serve a URL's response from memory (0 disables)
+            max_retries: Retries per request on network errors, HTTP 429 and 5xx
+            retry_base_delay: Initial backoff delay in seconds
+            retry_max_delay: Maximum backoff delay in seconds
         """
         self.timeout = timeout
         self.validate = validate
+        self.cache_ttl = cache_ttl
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
         self._client: Optional[httpx.AsyncClient] = None
+        # url -> (fetched_at monotonic, parsed JSON, ETag)
+        self._cache: Dict[str, Tuple[float, List[Dict], Optional[str]]] = {}
+        # (rate_type, count) -> URL for the "last N records" endpoints
+        self._count_url_cache: Dict[Tuple[RateType, int], str] = {}
+        self._warmup_task: Optional[asyncio.Task] = None
     
     async def __aenter__(self) -> "BCBClient":
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._client is None:
+            self._client = self._create_client()
+            # Resolve DNS and complete the TLS handshake in the background so
+            # the first real request finds a warm connection in the pool
+            self._warmup_task = asyncio.create_task(self._warmup())
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self.close()
+
+    async def _warmup(self) -> None:
+        """Open a pooled connection to the BCB host (failures are ignored)."""
+        try:
+            await self._client.head(self.WARMUP_URL)
+        except Exception as e:  # Best effort: the first real request will retry
+            logger.debug("BCB connection warmup failed: %s", e)
     
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create a pooled HTTP client (reused for the client's lifetime).
+
+        HTTP/2 multiplexes concurrent series requests over one TLS connection.
+        """
+        return httpx.AsyncClient(http2=True, timeout=self.timeout, limits=HTTP_LIMITS)
+
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = self._create_client()
         return self._client
     
     async def close(self) -> None:
         """Close the HTTP client."""
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+            self._warmup_task = None
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -343,12 +424,17 @@ class BCBClient:
         Returns:
             Full API URL
         """
-        config = RATE_CONFIGS[rate_type]
-        base = self.BASE_URL.format(series=config.bcb_series)
-        
         if count:
-            return f"{base}/ultimos/{count}?formato=json"
-        elif start_date and end_date:
+            # Constant per (rate, count): memoized for health checks and polls
+            url = self._count_url_cache.get((rate_type, count))
+            if url is None:
+                base = self.BASE_URL.format(series=RATE_CONFIGS[rate_type].bcb_series)
+                url = f"{base}/ultimos/{count}?formato=json"
+                self._count_url_cache[(rate_type, count)] = url
+            return url
+
+        base = self.BASE_URL.format(series=RATE_CONFIGS[rate_type].bcb_series)
+        if start_date and end_date:
             return f"{base}?formato=json&dataInicial={start_date}&dataFinal={end_date}"
         else:
             return f"{base}?formato=json"
@@ -370,12 +456,17 @@ class BCBClient:
         Raises:
             BCBParseError: Invalid date format
         """
+        # BCB always sends fixed-width DD/MM/YYYY: slice instead of strptime
+        if len(date_str) != 10 or date_str[2] != "/" or date_str[5] != "/":
+            raise BCBParseError(f"Invalid date format '{date_str}': expected DD/MM/YYYY")
         try:
-            dt = datetime.strptime(date_str, "%d/%m/%Y")
-            date_int = int(dt.strftime("%Y%m%d"))
-            return date_int, dt
+            year = int(date_str[6:10])
+            month = int(date_str[3:5])
+            day = int(date_str[0:2])
+            dt = datetime(year, month, day)
         except ValueError as e:
             raise BCBParseError(f"Invalid date format '{date_str}': {e}") from e
+        return year * 10000 + month * 100 + day, dt
     
     def _scale_to_chainlink(self, value: float) -> int:
         """
@@ -395,6 +486,41 @@ class BCBClient:
         # Use round() to handle floating point precision issues
         return int(round(value * CHAINLINK_PRECISION))
     
+    def _parse_bcb_decimal(self, value: Any) -> Tuple[int, float]:
+        """
+        Parse a BCB value into its Chainlink-scaled integer and float.
+
+        Decimal strings like "10.90" or "5,8123" are scaled exactly with
+        integer arithmetic (no float rounding error); the float is derived
+        from the scaled integer and equals float(value). Exponents, more than
+        8 fractional digits and numeric JSON values take the float path.
+
+        Args:
+            value: BCB "valor" field (string or number)
+
+        Returns:
+            Tuple of (scaled integer with 8 decimals, float value)
+
+        Raises:
+            ValueError: Value is not a number
+        """
+        if isinstance(value, str):
+            value = value.strip()
+            int_part, sep, frac_part = value.partition(".")
+            if not sep:
+                int_part, sep, frac_part = value.partition(",")
+            digits = int_part[1:] if int_part[:1] in ("+", "-") else int_part
+            # Plain digits only: int() would also accept "_" and whitespace,
+            # which would be counted as fractional digits and mis-scale the value
+            if len(frac_part) <= CHAINLINK_DECIMALS and (digits + frac_part).isdecimal():
+                scaled = int(int_part + frac_part) * _POW10[CHAINLINK_DECIMALS - len(frac_part)]
+                return scaled, scaled / CHAINLINK_PRECISION
+            # e.g. "1e-3": fall through to the float parser
+            raw_value = float(value.replace(",", "."))
+        else:
+            raw_value = float(value)
+        return self._scale_to_chainlink(raw_value), raw_value
+
     def _validate_value(self, rate_type: RateType, scaled_value: int, raw_value: float) -> None:
         """
         Validate value against circuit breaker bounds.
@@ -440,58 +566,124 @@ class BCBClient:
         """
         results = []
         config = RATE_CONFIGS[rate_type]
-        
+        # Bind per-rate constants and bound methods once, outside the record loop
+        source = SOURCE_BY_RATE[rate_type]
+        description = config.description
+        min_value, max_value = config.min_value, config.max_value
+        parse_date = self._parse_bcb_date
+        parse_decimal = self._parse_bcb_decimal
+        append = results.append
+
         for item in data:
             try:
                 # Parse date
-                date_int, dt = self._parse_bcb_date(item["data"])
-                
-                # Parse and scale value
+                date_str = item["data"]
+                date_int, dt = parse_date(date_str)
+
+                # Parse and scale to Chainlink 8-decimal format
                 # BCB uses comma as decimal separator in some locales
-                raw_str = str(item["valor"]).replace(",", ".")
-                raw_value = float(raw_str)
-                
-                # Scale to Chainlink 8-decimal format
-                scaled_value = self._scale_to_chainlink(raw_value)
-                
-                # Validate against circuit breakers
-                self._validate_value(rate_type, scaled_value, raw_value)
-                
-                results.append(RateData(
+                scaled_value, raw_value = parse_decimal(item["valor"])
+
+                append(RateData(
                     rate_type=rate_type,
                     answer=scaled_value,
                     raw_value=raw_value,
                     decimals=CHAINLINK_DECIMALS,
                     real_world_date=date_int,
-                    real_world_date_str=item["data"],
+                    real_world_date_str=date_str,
                     timestamp=dt,
-                    source=f"BCB-{config.bcb_series}",
-                    description=config.description,
+                    source=source,
+                    description=description,
                 ))
-                
-            except BCBValidationError:
-                raise  # Re-raise validation errors
+
             except BCBParseError as e:
-                logger.warning(f"Skipping invalid record for {rate_type.value}: {e}")
+                logger.warning("Skipping invalid record for %s: %s", rate_type.value, e)
                 continue
             except (KeyError, TypeError, ValueError) as e:
-                logger.warning(f"Skipping malformed record for {rate_type.value}: {e}")
+                logger.warning("Skipping malformed record for %s: %s", rate_type.value, e)
                 continue
-        
-        # Sort by date descending (most recent first)
-        results.sort(key=lambda x: x.real_world_date, reverse=True)
+
+        # Validate against circuit breakers in bulk: one min/max pass over the
+        # batch, then report the first offending record (in response order)
+        if self.validate and results:
+            answers = [r.answer for r in results]
+            if min(answers) < min_value or max(answers) > max_value:
+                for r in results:
+                    self._validate_value(rate_type, r.answer, r.raw_value)
+
+        # Order by date descending (most recent first). BCB returns records in
+        # chronological order, so a linear check + reverse avoids a sort.
+        if len(results) > 1:
+            dates = [r.real_world_date for r in results]
+            if all(a <= b for a, b in zip(dates, dates[1:])):
+                results.reverse()
+            elif not all(a >= b for a, b in zip(dates, dates[1:])):
+                results.sort(key=attrgetter("real_world_date"), reverse=True)
         return results
     
+    def _process_single(self, item: Dict, rate_type: RateType) -> RateData:
+        """
+        Process a single BCB record (the /ultimos/1 fast path).
+
+        Unlike _process_response, a malformed record is an error rather
+        than skipped, since there is nothing else to return.
+
+        Args:
+            item: Raw BCB record {"data": ..., "valor": ...}
+            rate_type: Type of rate
+
+        Returns:
+            RateData in Chainlink format
+
+        Raises:
+            BCBParseError: Malformed record
+            BCBValidationError: Value failed circuit breaker
+        """
+        try:
+            date_str = item["data"]
+            date_int, dt = self._parse_bcb_date(date_str)
+            scaled_value, raw_value = self._parse_bcb_decimal(item["valor"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise BCBParseError(f"Malformed record for {rate_type.value}: {e}") from e
+
+        self._validate_value(rate_type, scaled_value, raw_value)
+
+        config = RATE_CONFIGS[rate_type]
+        return RateData(
+            rate_type=rate_type,
+            answer=scaled_value,
+            raw_value=raw_value,
+            decimals=CHAINLINK_DECIMALS,
+            real_world_date=date_int,
+            real_world_date_str=date_str,
+            timestamp=dt,
+            source=SOURCE_BY_RATE[rate_type],
+            description=config.description,
+        )
+
     # =========================================================================
     # HTTP REQUESTS
     # =========================================================================
     
-    async def _request(self, url: str) -> List[Dict]:
+    async def _request(
+        self, url: str, max_retries: Optional[int] = None, use_cache: bool = True
+    ) -> List[Dict]:
         """
         Make HTTP request to BCB API.
 
+        Responses are cached per URL for cache_ttl seconds. Once an entry
+        expires it is revalidated with If-None-Match when BCB sent an ETag,
+        and a 304 reuses the cached body.
+
+        Transient failures (network errors, HTTP 429 and 5xx) are retried
+        with exponential backoff and jitter: base_delay * 2^attempt, capped
+        at retry_max_delay and scaled by a random factor in [0.5, 1.5).
+
         Args:
             url: Full API URL
+            max_retries: Override the client's retry count (0 = single attempt)
+            use_cache: If False, always ask BCB even when a fresh cached
+                response exists (a 304 revalidation still counts as an answer)
 
         Returns:
             Parsed JSON response
@@ -501,14 +693,46 @@ class BCBClient:
             BCBNoDataError: Empty response
             BCBParseError: Invalid response structure
         """
+        now = time.monotonic()
+        cached = self._cache.pop(url, None)
+        if cached is not None:
+            fetched_at, cached_data, etag = cached
+            if now - fetched_at < self.cache_ttl:
+                self._cache[url] = cached  # Re-insert as most recently used
+                if use_cache:
+                    return cached_data
+
         client = self._get_client()
+        if max_retries is None:
+            max_retries = self.max_retries
 
         try:
-            logger.debug(f"BCB API Request: {url}")
-            response = await client.get(url)
+            logger.debug("BCB API Request: %s", url)
+            headers = {"If-None-Match": cached[2]} if cached is not None and cached[2] else None
+            for attempt in range(max_retries + 1):
+                try:
+                    response = await client.get(url, headers=headers)
+                    if response.status_code >= 500 or response.status_code == 429:
+                        response.raise_for_status()
+                    break
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    if attempt == max_retries:
+                        raise
+                    delay = min(self.retry_base_delay * (2 ** attempt), self.retry_max_delay)
+                    delay *= 0.5 + random.random()
+                    logger.warning(
+                        "BCB request failed, retry %d/%d in %.1fs: %s",
+                        attempt + 1, max_retries, delay, e
+                    )
+                    await asyncio.sleep(delay)
+
+            if response.status_code == 304 and cached is not None:
+                self._store_cached(url, (now, cached[1], cached[2]))
+                return cached[1]
+
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if not data:
                 raise BCBNoDataError(f"Empty response from BCB API: {url}")
@@ -520,6 +744,7 @@ class BCBClient:
                     f"Expected list of {{data, valor}}, got: {type(data).__name__}"
                 )
 
+            self._store_cached(url, (now, data, response.headers.get("etag")))
             return data
 
         except httpx.HTTPStatusError as e:
@@ -531,6 +756,14 @@ class BCBClient:
         except ValueError as e:
             raise BCBParseError(f"Invalid JSON from BCB API: {e}") from e
     
+    def _store_cached(self, url: str, entry: Tuple[float, List[Dict], Optional[str]]) -> None:
+        """Cache a response, evicting the least recently used URL when full."""
+        if self.cache_ttl <= 0:
+            return
+        if len(self._cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[url] = entry
+
     # =========================================================================
     # PUBLIC API
     # =========================================================================
@@ -551,15 +784,18 @@ class BCBClient:
         """
         url = self._build_url(rate_type, count=1)
         data = await self._request(url)
-        results = self._process_response(data, rate_type)
-        
-        if not results:
-            raise BCBNoDataError(f"No valid data for {rate_type.value}")
-        
-        result = results[0]
+
+        if len(data) == 1:
+            result = self._process_single(data[0], rate_type)
+        else:
+            results = self._process_response(data, rate_type)
+            if not results:
+                raise BCBNoDataError(f"No valid data for {rate_type.value}")
+            result = results[0]
+
         logger.info(
-            f"Fetched {rate_type.value}: {result.raw_value} -> "
-            f"{result.answer} (8 dec) | {result.real_world_date_str}"
+            "Fetched %s: %s -> %s (8 dec) | %s",
+            rate_type.value, result.raw_value, result.answer, result.real_world_date_str
         )
         return result
     
@@ -582,7 +818,7 @@ class BCBClient:
         data = await self._request(url)
         results = self._process_response(data, rate_type)
         
-        logger.info(f"Fetched {len(results)} {rate_type.value} historical records")
+        logger.info("Fetched %d %s historical records", len(results), rate_type.value)
         return results
     
     async def fetch_date_range(
@@ -604,34 +840,91 @@ class BCBClient:
         """
         start_str = start_date.strftime("%d/%m/%Y")
         end_str = end_date.strftime("%d/%m/%Y")
-        
-        url = self._build_url(rate_type, start_date=start_str, end_date=end_str)
-        data = await self._request(url)
-        results = self._process_response(data, rate_type)
+
+        if (end_date - start_date).days > DATE_RANGE_SHARD_THRESHOLD_DAYS:
+            results = await self._fetch_date_range_sharded(rate_type, start_date, end_date)
+        else:
+            url = self._build_url(rate_type, start_date=start_str, end_date=end_str)
+            data = await self._request(url)
+            results = self._process_response(data, rate_type)
         
         logger.info(
-            f"Fetched {len(results)} {rate_type.value} records "
-            f"({start_str} to {end_str})"
+            "Fetched %d %s records (%s to %s)",
+            len(results), rate_type.value, start_str, end_str
         )
         return results
+
+    async def _fetch_date_range_sharded(
+        self,
+        rate_type: RateType,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[RateData]:
+        """
+        Fetch a long date range as concurrent monthly requests.
+
+        Shards share the pooled HTTP/2 connection (at most
+        MAX_CONCURRENT_SHARDS in flight), so wall time tracks the slowest
+        shard instead of one large response. Months without data are skipped.
+
+        Args:
+            rate_type: Type of rate to fetch
+            start_date: Start of range
+            end_date: End of range
+
+        Returns:
+            List of RateData, deduplicated by date, most recent first
+        """
+        shards = []
+        shard_start = start_date
+        while shard_start <= end_date:
+            if shard_start.month == 12:
+                next_month = shard_start.replace(year=shard_start.year + 1, month=1, day=1)
+            else:
+                next_month = shard_start.replace(month=shard_start.month + 1, day=1)
+            shards.append((shard_start, min(end_date, next_month - timedelta(days=1))))
+            shard_start = next_month
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SHARDS)
+
+        async def fetch_shard(shard_start: datetime, shard_end: datetime) -> List[RateData]:
+            url = self._build_url(
+                rate_type,
+                start_date=shard_start.strftime("%d/%m/%Y"),
+                end_date=shard_end.strftime("%d/%m/%Y")
+            )
+            async with semaphore:
+                try:
+                    data = await self._request(url)
+                except BCBNoDataError:
+                    return []
+            return self._process_response(data, rate_type)
+
+        # One failed shard fails the range: cancel the rest instead of
+        # letting them keep fetching in the background
+        tasks = [asyncio.ensure_future(fetch_shard(s, e)) for s, e in shards]
+        try:
+            shard_results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        by_date = {r.real_world_date: r for shard in shard_results for r in shard}
+        return sorted(by_date.values(), key=attrgetter("real_world_date"), reverse=True)
     
     async def fetch_all_latest(self) -> Dict[RateType, RateData]:
         """
-        Fetch latest values for all supported rates (sequential, for backward compat).
+        Fetch latest values for all supported rates concurrently.
+
+        Same as fetch_all_latest_parallel() for every rate type: rates that
+        fail with BCBClientError are logged and skipped.
 
         Returns:
             Dictionary mapping rate types to their latest values
         """
-        results = {}
-
-        for rate_type in RateType:
-            try:
-                results[rate_type] = await self.fetch_latest(rate_type)
-            except BCBClientError as e:
-                logger.error(f"Failed to fetch {rate_type.value}: {e}")
-                continue
-
-        return results
+        return await self.fetch_all_latest_parallel()
 
     async def fetch_all_latest_parallel(
         self,
@@ -652,13 +945,17 @@ class BCBClient:
         if rate_types is None:
             rate_types = list(RateType)
 
+        # Create the shared client before fanning out, so every request
+        # uses one pooled connection (total latency ~ the slowest series)
+        self._get_client()
+
         async def fetch_with_error_handling(rate_type: RateType) -> Tuple[RateType, Optional[RateData]]:
             """Wrapper to handle individual fetch errors."""
             try:
                 data = await self.fetch_latest(rate_type)
                 return (rate_type, data)
             except BCBClientError as e:
-                logger.error(f"Failed to fetch {rate_type.value}: {e}")
+                logger.error("Failed to fetch %s: %s", rate_type.value, e)
                 return (rate_type, None)
 
         # Fetch all rates concurrently
@@ -682,40 +979,18 @@ class BCBClient:
         max_delay: float = 60.0
     ) -> RateData:
         """
-        Fetch with exponential backoff retry.
-
-        Retries on transient errors (network, HTTP 5xx) with
-        exponential backoff: base_delay * 2^attempt.
-
-        Args:
-            rate_type: Rate to fetch
-            max_retries: Maximum retry attempts
-            base_delay: Initial delay in seconds
-            max_delay: Maximum delay between retries
-
-        Returns:
-            RateData on success
+        Deprecated: use fetch_latest.
 
-        Raises:
-            BCBClientError: After all retries exhausted
+        Network errors, HTTP 429 and 5xx are retried per request by the
+        client (see the max_retries constructor argument), so this only
+        delegates to fetch_latest; the retry arguments are ignored.
         """
-        last_error = None
-
-        for attempt in range(max_retries + 1):
-            try:
-                return await self.fetch_latest(rate_type)
-            except BCBClientError as e:
-                last_error = e
-                if attempt < max_retries:
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.warning(
-                        f"Retry {attempt + 1}/{max_retries} for {rate_type.value} "
-                        f"after {delay:.1f}s: {e}"
-                    )
-                    await asyncio.sleep(delay)
-
-        # All retries exhausted
-        raise last_error
+        warnings.warn(
+            "BCBClient.fetch_with_retry is deprecated; use fetch_latest",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return await self.fetch_latest(rate_type)
 
     def validate_response_structure(self, data: Any) -> bool:
         """
@@ -753,7 +1028,11 @@ class BCBClient:
             True if API is responding
         """
         try:
-            await self.fetch_latest(RateType.CDI)
+            # Single attempt, bypassing the response cache: a health probe
+            # should report a live failure, not retry it or hide it
+            url = self._build_url(RateType.CDI, count=1)
+            data = await self._request(url, max_retries=0, use_cache=False)
+            self._process_response(data, RateType.CDI)
             return True
         except BCBClientError:
             return False
@@ -776,17 +1055,26 @@ class BCBClient:
 class BCBClientSync:
     """
     Synchronous wrapper for BCBClient.
-    
+
+    Runs every call on one persistent event loop with the HTTP client entered
+    once, so all calls share the same connection pool. Not thread-safe: use
+    one instance per thread.
+
     Usage:
-        client = BCBClientSync()
-        cdi = client.fetch_latest(RateType.CDI)
-        client.close()
+        with BCBClientSync() as client:
+            cdi = client.fetch_latest(RateType.CDI)
     """
     
     def __init__(self, validate: bool = True):
-        import asyncio
         self._loop = asyncio.new_event_loop()
         self._client = BCBClient(validate=validate)
+        self._run(self._client.__aenter__())
+
+    def __enter__(self) -> "BCBClientSync":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     def _run(self, coro):
         return self._loop.run_until_complete(coro)
@@ -804,7 +1092,9 @@ class BCBClientSync:
         return self._run(self._client.health_check())
     
     def close(self) -> None:
-        self._run(self._client.close())
+        if self._loop.is_closed():
+            return
+        self._run(self._client.__aexit__(None, None, None))
         self._loop.close()
 
 
@@ -3,7 +3,8 @@ DELOS Configuration Management
 Centralized settings using Pydantic for type safety and validation.
 """
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -34,6 +35,7 @@ class Settings(BaseSettings):
     anomaly_std_threshold: float = 3.0  # Flag if > N std devs from mean
     anomaly_lookback_days: int = 30  # Historical window for statistics
     anomaly_velocity_threshold: float = 0.5  # Max 50% daily change
+    anomaly_method: str = "hampel"  # "hampel" (median/MAD) or "zscore" (mean/std)
 
     # Data Storage Configuration
     database_path: str = "data/rates.db"
@@ -41,6 +43,9 @@ class Settings(BaseSettings):
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    # Each worker runs its own scheduler and response cache; keep at 1
+    # unless the scheduler is deployed as a separate process
+    api_workers: int = 1
     cors_origins: str = "*"  # Comma-separated list or "*" for all
 
     # Alerting Configuration (optional)
@@ -51,13 +56,19 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_json_format: bool = True  # JSON logs for production
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
         # Also check parent contracts directory for shared .env
-        env_file = [".env", "../contracts/.env"]
-        extra = "ignore"  # Ignore extra fields from contracts/.env
+        env_file=(".env", "../contracts/.env"),
+        env_file_encoding="utf-8",
+        extra="ignore",  # Ignore extra fields from contracts/.env
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings (environment and .env files are read once)."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
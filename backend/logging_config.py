@@ -4,11 +4,12 @@ Production-ready JSON logging with request/response tracing.
 """
 
 import logging
-import json
 import sys
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+import orjson
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -31,11 +32,13 @@ class JSONFormatter(logging.Formatter):
         "z_score",
         "request_id",
     ]
+    _EXTRA_SET = frozenset(EXTRA_FIELDS)
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON string."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # record.created is set by logging when the record is made
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -44,16 +47,17 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add extra fields if present
-        for field in self.EXTRA_FIELDS:
-            if hasattr(record, field):
-                log_data[field] = getattr(record, field)
+        # Add extra fields if present (one pass over the record's attributes)
+        extra_set = self._EXTRA_SET
+        for key, value in record.__dict__.items():
+            if key in extra_set:
+                log_data[key] = value
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, default=str)
+        return orjson.dumps(log_data, default=str).decode()
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -8,29 +8,154 @@ Chainlink Standard: 8 decimals for all fiat feeds
 """
 
 import asyncio
+import hashlib
 import logging
 import json
 import os
-from typing import Optional, Dict, List, Tuple
+import time
+from collections import deque
+from typing import Optional, Dict, List, Tuple, Deque, Hashable, Set
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
+from contextlib import asynccontextmanager
 
-from web3 import AsyncWeb3
-from web3.exceptions import ContractLogicError
+import aiohttp
+import orjson
+
+from web3 import AsyncWeb3, WebSocketProvider
+from web3.exceptions import ContractLogicError, TimeExhausted, TransactionNotFound
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector, keccak
 from dotenv import load_dotenv
 
 from bcb_client import BCBClient, RateType, RateData, CHAINLINK_DECIMALS
+from logging_config import setup_logging
 
 # Load .env from contracts directory (shared config)
 ENV_PATH = Path(__file__).parent.parent / "contracts" / ".env"
 load_dotenv(ENV_PATH)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 PRECISION = 10 ** CHAINLINK_DECIMALS  # 10^8
 
+ABI_PATH = Path(__file__).parent.parent / "contracts/artifacts/contracts/BrazilianMacroOracle.sol/BrazilianMacroOracle.json"
+
+# Update decisions from _decide_update; codes >= DECISION_NEW_DATE need a tx
+DECISION_SAME_DATE = 0
+DECISION_OLDER_DATE = 1
+DECISION_NEW_DATE = 2
+DECISION_NO_DATA = 3
+
+# Multicall3 is deployed at the same address on every major chain,
+# including Arbitrum Sepolia (https://www.multicall3.com)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "name": "aggregate3",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [{
+            "name": "calls",
+            "type": "tuple[]",
+            "components": [
+                {"name": "target", "type": "address"},
+                {"name": "allowFailure", "type": "bool"},
+                {"name": "callData", "type": "bytes"},
+            ],
+        }],
+        "outputs": [{
+            "name": "returnData",
+            "type": "tuple[]",
+            "components": [
+                {"name": "success", "type": "bool"},
+                {"name": "returnData", "type": "bytes"},
+            ],
+        }],
+    }
+]
+
+# Recent gas_used samples kept per call shape for gas limit sizing
+GAS_HISTORY_SIZE = 16
+
+# EIP-1559 fee parameters are derived from eth_feeHistory and reused
+# for this many seconds (Arbitrum base fee moves slowly between blocks)
+FEE_CACHE_TTL = 15.0
+FEE_HISTORY_BLOCKS = 5
+FEE_REWARD_PERCENTILE = 50
+
+# Last known on-chain real_world_date per rate, keyed by "chain_id:oracle
+# address". Lets steady-state syncs (BCB unchanged since the last write)
+# skip the on-chain read entirely.
+DATE_CACHE_PATH = Path(
+    os.getenv("DELOS_DATE_CACHE", Path.home() / ".cache" / "delos-oracle" / "dates.json")
+)
+
+# Date cache keys checked against a full on-chain snapshot in this process.
+# Persisted dates are only trusted after that (a restarted local node reuses
+# both the chain id and the deterministic contract address).
+_VALIDATED_DATE_CACHES: Set[str] = set()
+
+# Connection pool for the RPC provider's aiohttp session
+RPC_CONNECTION_LIMIT = 32
+RPC_KEEPALIVE_TIMEOUT = 60
+
+# Errors reaching the RPC node itself: retrying per rate won't help
+RPC_TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OSError)
+
+# getRate(string) returns (answer, timestamp, realWorldDate)
+GET_RATE_OUTPUT_TYPES = ["int256", "uint256", "uint256"]
+
+
+@lru_cache(maxsize=1)
+def _load_abi() -> list:
+    """
+    Load the oracle ABI from hardhat artifacts.
+    
+    Parsed once per process; only the "abi" list is kept, not the
+    bytecode and metadata that make up the rest of the artifact.
+    """
+    if not ABI_PATH.exists():
+        raise FileNotFoundError(f"ABI not found at {ABI_PATH}. Run 'npx hardhat compile' first.")
+    
+    return orjson.loads(ABI_PATH.read_bytes())["abi"]
+
+
+@lru_cache(maxsize=32)
+def _checksum(address: str) -> str:
+    """Checksum an address once per process (keccak over the hex string)."""
+    return AsyncWeb3.to_checksum_address(address)
+
+
+def _function_spec(abi: list, name: str) -> Tuple[bytes, List[str]]:
+    """Selector and input types for a contract function, for direct calldata encoding."""
+    fn_abi = next(e for e in abi if e["type"] == "function" and e["name"] == name)
+    return function_abi_to_4byte_selector(fn_abi), [i["type"] for i in fn_abi["inputs"]]
+
+
+# Derived signers, keyed by a digest of the private key so the key itself
+# is never used as a dict key
+_SIGNERS: Dict[bytes, LocalAccount] = {}
+_SIGNER_CACHE_SIZE = 4
+
+
+def _get_signer(private_key: str) -> LocalAccount:
+    """
+    Get the LocalAccount for a private key, deriving it once per process.
+    
+    Account.from_key performs a secp256k1 public key derivation, which is
+    repeated for every OracleUpdater otherwise.
+    """
+    key_hash = hashlib.blake2b(private_key.encode(), digest_size=16).digest()
+    signer = _SIGNERS.get(key_hash)
+    if signer is None:
+        if len(_SIGNERS) >= _SIGNER_CACHE_SIZE:
+            _SIGNERS.pop(next(iter(_SIGNERS)))
+        signer = _SIGNERS[key_hash] = Account.from_key(private_key)
+    return signer
+
 
 @dataclass
 class UpdateResult:
@@ -45,16 +170,48 @@ class UpdateResult:
     details: Optional[Dict] = None
 
 
+@dataclass
+class PreparedBatch:
+    """
+    A batchUpdateRates transaction that has not been broadcast yet.
+
+    tx has everything but the nonce, which submit_and_wait() reads right
+    before signing so other senders in between can't invalidate it. result
+    is set instead of tx when there is nothing to send (no BCB data,
+    everything up to date, or preparation failed).
+    """
+    to_update: List[RateData]
+    to_skip: List[RateData]
+    gas_key: Optional[Hashable] = None
+    tx: Optional[Dict] = None
+    result: Optional[UpdateResult] = None
+
+
 class OracleUpdater:
-    """Updates Oracle contract with BCB data on Arbitrum Sepolia."""
+    """
+    Updates Oracle contract with BCB data on Arbitrum Sepolia.
+    
+    Use as an async context manager to open one keep-alive RPC session and
+    one BCB client for the updater's lifetime:
+    
+        async with OracleUpdater() as updater:
+            await updater.sync_all_rates()
+    
+    A BCBClient owned by the caller (e.g. the API's shared client) can be
+    passed as bcb; it is used as-is and never closed by the updater.
+    """
     
     def __init__(
         self, 
         rpc_url: Optional[str] = None, 
         contract_address: Optional[str] = None, 
-        private_key: Optional[str] = None
+        private_key: Optional[str] = None,
+        ws_url: Optional[str] = None,
+        bcb: Optional[BCBClient] = None
     ):
         self.rpc_url = rpc_url or os.getenv("ARBITRUM_SEPOLIA_RPC", "https://sepolia-rollup.arbitrum.io/rpc")
+        # Optional: when set, receipts are awaited via newHeads instead of polling
+        self.ws_url = ws_url or os.getenv("ARBITRUM_SEPOLIA_WS")
         self.contract_address = contract_address or os.getenv("ORACLE_ADDRESS")
         self.private_key = private_key or os.getenv("PRIVATE_KEY")
         
@@ -63,33 +220,328 @@ class OracleUpdater:
         if not self.private_key:
             raise ValueError("PRIVATE_KEY not set")
         
-        self.contract_address = AsyncWeb3.to_checksum_address(self.contract_address)
+        self.contract_address = _checksum(self.contract_address)
         self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_url))
-        self.account = Account.from_key(self.private_key)
+        self.account = _get_signer(self.private_key)
         
-        # Load ABI from hardhat artifacts
-        abi_path = Path(__file__).parent.parent / "contracts/artifacts/contracts/BrazilianMacroOracle.sol/BrazilianMacroOracle.json"
-        if not abi_path.exists():
-            raise FileNotFoundError(f"ABI not found at {abi_path}. Run 'npx hardhat compile' first.")
-        
-        with open(abi_path) as f:
-            artifact = json.load(f)
-            self.contract_abi = artifact["abi"]
+        self.contract_abi = _load_abi()
         
         self.contract = self.w3.eth.contract(
             address=self.contract_address,
             abi=self.contract_abi
         )
+        self.multicall = self.w3.eth.contract(
+            address=_checksum(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+        
+        # Invariant for the updater's lifetime; derived/memoized once
+        self._update_rate_spec = _function_spec(self.contract_abi, "updateRate")
+        self._batch_spec = _function_spec(self.contract_abi, "batchUpdateRates")
+        self._rate_updated_topic = event_abi_to_log_topic(
+            next(e for e in self.contract_abi if e["type"] == "event" and e["name"] == "RateUpdated")
+        )
+        # RateUpdated's indexed rateType string is logged as its keccak hash
+        self._rate_type_topics = {keccak(text=rt.value): rt.value for rt in RateType}
+        self._chain_id: Optional[int] = None
+        self._gas_history: Dict[Hashable, Deque[int]] = {}
+        self._fees: Optional[Dict[str, int]] = None
+        self._fees_at = 0.0
+        self._ws: Optional[AsyncWeb3] = None
+        self._ws_lock = asyncio.Lock()  # Concurrent receipt waits share one connection
+        self.bcb = bcb
+        self._owns_bcb = False
+        self._pending_receipts: Set[asyncio.Task] = set()
+        self._date_cache: Dict[str, int] = {}
+        self._date_cache_key: Optional[str] = None
         
         logger.info(f"OracleUpdater initialized")
         logger.info(f"  Updater: {self.account.address}")
         logger.info(f"  Oracle:  {self.contract_address}")
         logger.info(f"  RPC:     {self.rpc_url}")
 
+    async def __aenter__(self):
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=RPC_CONNECTION_LIMIT,
+                keepalive_timeout=RPC_KEEPALIVE_TIMEOUT
+            )
+        )
+        await self.w3.provider.cache_async_session(session)
+        if self.bcb is None:
+            self.bcb = await BCBClient().__aenter__()
+            self._owns_bcb = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the RPC session, any WebSocket connection and an owned BCB client.
+        
+        Background confirmations still pending are cancelled; their
+        transactions stay submitted but their outcome is no longer logged.
+        """
+        for task in self._pending_receipts:
+            task.cancel()
+        await self.w3.provider.disconnect()
+        async with self._ws_lock:
+            if self._ws is not None:
+                await self._ws.provider.disconnect()
+                self._ws = None
+        if self._owns_bcb:
+            await self.bcb.close()
+            self.bcb = None
+            self._owns_bcb = False
+
+    @asynccontextmanager
+    async def _bcb_session(self):
+        """Yield the updater's BCB client, or a temporary one outside a context."""
+        if self.bcb is not None:
+            yield self.bcb
+        else:
+            async with BCBClient() as bcb:
+                yield bcb
+
+    # =========================================================================
+    # On-chain date cache
+    # =========================================================================
+
+    async def _load_date_cache(self) -> None:
+        """Load cached on-chain dates for this chain and oracle, once (empty on any error)."""
+        if self._date_cache_key is not None:
+            return
+        key = f"{await self._get_chain_id()}:{self.contract_address}"
+        try:
+            data = orjson.loads(DATE_CACHE_PATH.read_bytes())
+            loaded = {rt: int(d) for rt, d in data.get(key, {}).items()}
+        except (OSError, ValueError, AttributeError, TypeError):
+            loaded = {}
+        # Dates learned before the load are newer than the file's
+        self._date_cache = {**loaded, **self._date_cache}
+        self._date_cache_key = key
+
+    def _dates_trusted(self) -> bool:
+        """Whether cached dates may settle update checks without a chain read."""
+        return self._date_cache_key in _VALIDATED_DATE_CACHES
+
+    def _save_date_cache(self) -> None:
+        """Persist cached dates, keeping other oracles' entries."""
+        if self._date_cache_key is None:
+            return
+        try:
+            try:
+                data = orjson.loads(DATE_CACHE_PATH.read_bytes())
+                if not isinstance(data, dict):
+                    data = {}
+            except (OSError, ValueError):
+                data = {}
+            data[self._date_cache_key] = self._date_cache
+            DATE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process temp file: the API and scheduler may save concurrently
+            tmp_path = DATE_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(data))
+            tmp_path.replace(DATE_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not write date cache {DATE_CACHE_PATH}: {e}")
+
+    def _remember_dates(self, dates: Dict[str, int]) -> None:
+        """Merge known on-chain dates into the cache, writing only on change."""
+        changed = {rt: d for rt, d in dates.items() if self._date_cache.get(rt) != d}
+        if changed:
+            self._date_cache.update(changed)
+            self._save_date_cache()
+
+    def _forget_dates(self, rate_types: List[str]) -> None:
+        """Invalidate cached dates after a failed transaction."""
+        if any(rt in self._date_cache for rt in rate_types):
+            for rt in rate_types:
+                self._date_cache.pop(rt, None)
+            self._save_date_cache()
+
+    def _cached_current(self, rate_data: RateData) -> Optional[Dict]:
+        """
+        Cached on-chain rate stub if it already settles the update check.
+        
+        Only a cached date at or after the BCB date is conclusive (skip);
+        anything else, or a cache not yet validated in this process, needs
+        a fresh on-chain read.
+        """
+        if not self._dates_trusted():
+            return None
+        cached = self._date_cache.get(rate_data.rate_type.value)
+        if cached is not None and rate_data.real_world_date <= cached:
+            return {"real_world_date": cached}
+        return None
+
+    async def _get_chain_id(self) -> int:
+        """Get the chain id, querying the RPC only on first use."""
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+        return self._chain_id
+
+    async def _get_fees(self) -> Dict[str, int]:
+        """
+        EIP-1559 fee fields for build_transaction, cached for FEE_CACHE_TTL.
+        
+        Uses one eth_feeHistory call: the pending block's base fee and the
+        median priority fee over the last FEE_HISTORY_BLOCKS blocks.
+        maxFeePerGas = 2 * baseFee + tip leaves headroom for base fee
+        increases while the transaction waits for inclusion.
+        """
+        now = time.monotonic()
+        if self._fees is not None and now - self._fees_at < FEE_CACHE_TTL:
+            return self._fees
+        
+        history = await self.w3.eth.fee_history(
+            FEE_HISTORY_BLOCKS, "latest", [FEE_REWARD_PERCENTILE]
+        )
+        base_fee = history["baseFeePerGas"][-1]
+        rewards = sorted(r[0] for r in history.get("reward") or [] if r)
+        tip = rewards[len(rewards) // 2] if rewards else 0
+        
+        self._fees = {
+            "maxFeePerGas": 2 * base_fee + tip,
+            "maxPriorityFeePerGas": tip,
+        }
+        self._fees_at = now
+        return self._fees
+
+    async def _try_get_receipt(self, tx_hash):
+        """Get a transaction receipt, or None if not yet mined."""
+        try:
+            return await self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    async def _get_ws(self) -> AsyncWeb3:
+        """Get the shared WebSocket connection, opening it on first use."""
+        async with self._ws_lock:
+            if self._ws is None:
+                # Single connection attempt: on failure the caller falls back to polling
+                self._ws = await AsyncWeb3(WebSocketProvider(self.ws_url, max_connection_retries=1))
+            return self._ws
+
+    async def _drop_ws(self, ws: AsyncWeb3) -> None:
+        """Disconnect a failed WebSocket connection unless it was already replaced."""
+        async with self._ws_lock:
+            if self._ws is ws:
+                self._ws = None
+                await ws.provider.disconnect()
+
+    async def _wait_for_receipt_ws(self, tx_hash):
+        """Check for the receipt once per new block head."""
+        ws = await self._get_ws()
+        try:
+            subscription_id = await ws.eth.subscribe("newHeads")
+        except Exception:
+            await self._drop_ws(ws)
+            raise
+        
+        try:
+            # Checked after subscribing so a block mined in between isn't missed
+            receipt = await self._try_get_receipt(tx_hash)
+            if receipt is not None:
+                return receipt
+            async for _ in ws.socket.process_subscriptions():
+                receipt = await self._try_get_receipt(tx_hash)
+                if receipt is not None:
+                    return receipt
+        except Exception:
+            await self._drop_ws(ws)
+            raise
+        finally:
+            try:
+                await ws.eth.unsubscribe(subscription_id)
+            except Exception:
+                pass
+
+    async def _wait_for_receipt(self, tx_hash, timeout: float):
+        """
+        Wait for a transaction receipt.
+        
+        With ws_url configured, a newHeads subscription triggers one receipt
+        lookup per block rather than web3's fixed-interval polling. Falls
+        back to polling if the WebSocket path fails.
+        
+        Raises:
+            TimeExhausted: If no receipt arrives within timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        if self.ws_url:
+            try:
+                return await asyncio.wait_for(self._wait_for_receipt_ws(tx_hash), timeout)
+            except asyncio.TimeoutError:
+                raise TimeExhausted(
+                    f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds"
+                )
+            except Exception as e:
+                logger.warning(f"WebSocket receipt wait failed, polling instead: {e}")
+        
+        remaining = max(deadline - time.monotonic(), 0.1)
+        return await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=remaining)
+
+    def _encode_call(self, spec: Tuple[bytes, List[str]], args: tuple) -> bytes:
+        """
+        ABI-encode calldata for a pre-resolved function spec.
+        
+        Skips the per-call function lookup of ContractFunction, and the
+        result is reused for both gas estimation and the signed transaction.
+        """
+        selector, input_types = spec
+        return selector + self.w3.codec.encode(input_types, args)
+
+    def _build_tx(self, data: bytes, nonce: Optional[int], gas: int, chain_id: int, fees: Dict[str, int]) -> Dict:
+        """Build an EIP-1559 transaction calling the oracle with encoded calldata (nonce None: set later)."""
+        return {
+            "from": self.account.address,
+            "to": self.contract_address,
+            "data": data,
+            "value": 0,
+            "nonce": nonce,
+            "gas": gas,
+            "chainId": chain_id,
+            **fees
+        }
+
+    async def _gas_limit(self, key: Hashable, data: bytes, margin: float) -> int:
+        """
+        Gas limit for a call, sized from recent receipts when available.
+        
+        updateRate/batchUpdateRates cost roughly the same gas for the same
+        batch size, so once a call shape has succeeded its observed gas_used
+        replaces the eth_estimateGas round-trip.
+        
+        Args:
+            key: Call shape (function name, plus batch size for batches), or
+                None to always estimate
+            data: Encoded calldata, estimated on a cache miss
+            margin: Safety multiplier applied to the gas figure
+        """
+        history = self._gas_history.get(key) if key is not None else None
+        if history:
+            return int(max(history) * margin)
+        gas_estimate = await self.w3.eth.estimate_gas({
+            "from": self.account.address,
+            "to": self.contract_address,
+            "data": data
+        })
+        return int(gas_estimate * margin)
+
+    def _record_gas(self, key: Hashable, receipt) -> None:
+        """Record gas_used from a receipt; a revert drops the history for key."""
+        if key is None:
+            return
+        if receipt["status"] == 1:
+            self._gas_history.setdefault(key, deque(maxlen=GAS_HISTORY_SIZE)).append(receipt["gasUsed"])
+        else:
+            self._gas_history.pop(key, None)
+
     async def check_connection(self) -> bool:
         """Verify connection to the blockchain."""
         try:
-            chain_id = await self.w3.eth.chain_id
+            chain_id = await self._get_chain_id()
             block = await self.w3.eth.block_number
             logger.info(f"Connected to chain {chain_id}, block {block}")
             return True
@@ -102,6 +554,18 @@ class OracleUpdater:
         balance_wei = await self.w3.eth.get_balance(self.account.address)
         return float(self.w3.from_wei(balance_wei, "ether"))
 
+    @staticmethod
+    def _format_rate(rate_type: str, result) -> Dict:
+        """Convert a getRate (answer, timestamp, realWorldDate) tuple to a dict."""
+        answer = result[0]  # int256
+        return {
+            "rate_type": rate_type,
+            "answer": answer,
+            "timestamp": result[1],
+            "real_world_date": result[2],
+            "value_percent": answer / PRECISION  # Convert to percentage
+        }
+
     async def get_current_rate(self, rate_type: str) -> Optional[Dict]:
         """
         Get current rate from oracle contract.
@@ -111,27 +575,107 @@ class OracleUpdater:
         """
         try:
             result = await self.contract.functions.getRate(rate_type).call()
-            answer = result[0]  # int256
-            return {
-                "rate_type": rate_type,
-                "answer": answer,
-                "timestamp": result[1],
-                "real_world_date": result[2],
-                "value_percent": answer / PRECISION  # Convert to percentage
-            }
+            return self._format_rate(rate_type, result)
         except ContractLogicError as e:
             logger.warning(f"Rate {rate_type} not found: {e}")
             return None
 
-    async def get_all_current_rates(self) -> Dict[str, Dict]:
-        """Get all current rates from oracle."""
+    async def _multicall_current_rates(self) -> Dict[str, Dict]:
+        """
+        Read every rate in a single eth_call through Multicall3 aggregate3.
+        
+        Calls are sent with allowFailure=True, so a rate that is missing
+        on-chain (getRate reverts) is simply left out of the result.
+        """
+        rate_types = [rate_type.value for rate_type in RateType]
+        calls = [
+            (self.contract_address, True, self.contract.encode_abi("getRate", args=[rate_type]))
+            for rate_type in rate_types
+        ]
+        responses = await self.multicall.functions.aggregate3(calls).call()
+        
         results = {}
-        for rate_type in RateType:
-            rate = await self.get_current_rate(rate_type.value)
-            if rate:
-                results[rate_type.value] = rate
+        for rate_type, (success, return_data) in zip(rate_types, responses):
+            if not success:
+                logger.warning(f"Rate {rate_type} not found")
+                continue
+            decoded = self.w3.codec.decode(GET_RATE_OUTPUT_TYPES, return_data)
+            results[rate_type] = self._format_rate(rate_type, decoded)
+        return results
+
+    async def get_all_current_rates(self) -> Dict[str, Dict]:
+        """
+        Get all current rates from oracle.
+        
+        Uses a single Multicall3 round-trip, falling back to concurrent
+        per-rate getRate calls if Multicall3 is unavailable.
+        
+        Raises:
+            Exception: If the RPC node is unreachable or every read failed
+                (an outage must not look like an oracle with no rates)
+        """
+        try:
+            results = await self._multicall_current_rates()
+        except RPC_TRANSPORT_ERRORS:
+            raise
+        except Exception as e:
+            logger.warning(f"Multicall3 read failed, falling back to per-rate calls: {e}")
+            rate_values = [rate_type.value for rate_type in RateType]
+            rates = await asyncio.gather(
+                *[self.get_current_rate(rt) for rt in rate_values],
+                return_exceptions=True
+            )
+            errors = [rate for rate in rates if isinstance(rate, Exception)]
+            if len(errors) == len(rates):
+                raise errors[0]
+            results = {}
+            for rt, rate in zip(rate_values, rates):
+                if isinstance(rate, Exception):
+                    # One failed read shouldn't discard the others
+                    logger.warning(f"Failed to read {rt} from oracle: {rate}")
+                elif rate:
+                    results[rt] = rate
+        
+        # A full snapshot replaces the cache (rates missing on-chain are
+        # dropped) and validates it for the rest of the process
+        await self._load_date_cache()
+        snapshot = {rt: r["real_world_date"] for rt, r in results.items()}
+        _VALIDATED_DATE_CACHES.add(self._date_cache_key)
+        if snapshot != self._date_cache:
+            self._date_cache = snapshot
+            self._save_date_cache()
         return results
 
+    @staticmethod
+    def _decide_update(current: Optional[Dict], rate_data: RateData) -> int:
+        """Decide whether rate_data supersedes the current on-chain rate (DECISION_* code)."""
+        if current is None:
+            return DECISION_NO_DATA
+        current_date = current["real_world_date"]
+        new_date = rate_data.real_world_date
+        if current_date == new_date:
+            return DECISION_SAME_DATE
+        if current_date > new_date:
+            return DECISION_OLDER_DATE
+        return DECISION_NEW_DATE
+
+    @staticmethod
+    def _format_reason(decision: int, current: Optional[Dict], rate_data: RateData) -> str:
+        """Human-readable reason string for a DECISION_* code."""
+        if decision == DECISION_NO_DATA:
+            return "no_existing_data"
+        if decision == DECISION_SAME_DATE:
+            return f"same_date:{rate_data.real_world_date}"
+        if decision == DECISION_OLDER_DATE:
+            return f"bcb_data_older:{rate_data.real_world_date}<{current['real_world_date']}"
+        return f"new_date:{current['real_world_date']}->{rate_data.real_world_date}"
+
+    @classmethod
+    def _compare_dates(cls, current: Optional[Dict], rate_data: RateData) -> Tuple[bool, str]:
+        """Decide whether rate_data supersedes the current rate, with a reason."""
+        decision = cls._decide_update(current, rate_data)
+        return decision >= DECISION_NEW_DATE, cls._format_reason(decision, current, rate_data)
+
     async def check_needs_update(self, rate_data: RateData) -> Tuple[bool, str]:
         """
         Check if a rate needs updating based on date.
@@ -139,18 +683,40 @@ class OracleUpdater:
         Returns:
             Tuple of (needs_update: bool, reason: str)
         """
-        current = await self.get_current_rate(rate_data.rate_type.value)
-        
+        await self._load_date_cache()
+        current = self._cached_current(rate_data)
         if current is None:
-            return True, "no_existing_data"
+            current = await self.get_current_rate(rate_data.rate_type.value)
+            if current is not None:
+                self._remember_dates({current["rate_type"]: current["real_world_date"]})
+        return self._compare_dates(current, rate_data)
+
+    async def check_all_needs_update(
+        self,
+        rates: Dict[RateType, RateData],
+        current_rates: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Tuple[bool, str]]:
+        """
+        Check several rates against a single on-chain snapshot.
         
-        if current["real_world_date"] == rate_data.real_world_date:
-            return False, f"same_date:{rate_data.real_world_date}"
+        Reads every current rate once (see get_all_current_rates) and
+        compares dates locally, instead of one getRate call per rate.
         
-        if current["real_world_date"] > rate_data.real_world_date:
-            return False, f"bcb_data_older:{rate_data.real_world_date}<{current['real_world_date']}"
+        Args:
+            rates: BCB rates to check
+            current_rates: Preloaded get_all_current_rates() snapshot (read if omitted)
         
-        return True, f"new_date:{current['real_world_date']}->{rate_data.real_world_date}"
+        Returns:
+            Dict mapping rate type value to (needs_update, reason)
+        """
+        if current_rates is None:
+            current_rates = await self.get_all_current_rates()
+        return {
+            rate_data.rate_type.value: self._compare_dates(
+                current_rates.get(rate_data.rate_type.value), rate_data
+            )
+            for rate_data in rates.values()
+        }
 
     async def sync_rate(self, rate_type: RateType, force: bool = False) -> UpdateResult:
         """
@@ -160,7 +726,7 @@ class OracleUpdater:
             rate_type: Rate to sync
             force: If True, update even if same date (will revert on-chain)
         """
-        async with BCBClient() as bcb:
+        async with self._bcb_session() as bcb:
             rate_data = await bcb.fetch_latest(rate_type)
             
             # Check if update needed
@@ -182,41 +748,41 @@ class OracleUpdater:
         try:
             logger.info(f"Updating {rate_data.rate_type.value}: {rate_data.raw_value}% ({rate_data.answer} scaled)")
             
-            nonce = await self.w3.eth.get_transaction_count(self.account.address)
-            gas_price = await self.w3.eth.gas_price
-            chain_id = await self.w3.eth.chain_id
-            
-            tx_data = self.contract.functions.updateRate(
+            data = self._encode_call(self._update_rate_spec, (
                 rate_data.rate_type.value,
                 rate_data.answer,  # Already 8 decimals from BCBClient
                 rate_data.real_world_date,
                 rate_data.source
-            )
+            ))
+            gas_key = "updateRate"
             
-            gas_estimate = await tx_data.estimate_gas({"from": self.account.address})
-            gas_limit = int(gas_estimate * 1.2)
+            # Gas sizing doesn't depend on nonce/fees; issue all reads together
+            gas_limit, nonce, fees, chain_id = await asyncio.gather(
+                self._gas_limit(gas_key, data, 1.2),
+                self.w3.eth.get_transaction_count(self.account.address),
+                self._get_fees(),
+                self._get_chain_id(),
+            )
             
-            tx = await tx_data.build_transaction({
-                "from": self.account.address,
-                "nonce": nonce,
-                "gas": gas_limit,
-                "gasPrice": gas_price,
-                "chainId": chain_id
-            })
+            tx = self._build_tx(data, nonce, gas_limit, chain_id, fees)
             
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.private_key)
+            signed_tx = await asyncio.to_thread(self.account.sign_transaction, tx)
             tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
             
             logger.info(f"TX sent: {tx_hash.hex()}")
             
-            receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            receipt = await self._wait_for_receipt(tx_hash, timeout=120)
+            self._record_gas(gas_key, receipt)
             
             success = receipt["status"] == 1
             
             if success:
                 logger.info(f"✓ {rate_data.rate_type.value} updated - Block: {receipt['blockNumber']}")
+                if rate_data.rate_type.value in self._updated_rate_types(receipt):
+                    self._remember_dates({rate_data.rate_type.value: rate_data.real_world_date})
             else:
                 logger.error(f"✗ {rate_data.rate_type.value} TX failed")
+                self._forget_dates([rate_data.rate_type.value])
             
             return UpdateResult(
                 success=success,
@@ -230,126 +796,255 @@ class OracleUpdater:
             
         except Exception as e:
             logger.error(f"Update failed for {rate_data.rate_type.value}: {e}")
+            self._forget_dates([rate_data.rate_type.value])
             return UpdateResult(success=False, error=str(e))
 
-    async def sync_all_rates(self, force: bool = False) -> UpdateResult:
+    def _updated_rate_types(self, receipt) -> Set[str]:
         """
-        Fetch all rates from BCB and update oracle using batch function.
+        Rate types with a RateUpdated event from this oracle in a receipt.
+        
+        Only these actually changed: a successful batch still silently skips
+        entries (same date, inactive rate, tripped circuit breaker, ...).
+        """
+        return {
+            self._rate_type_topics[log["topics"][1]]
+            for log in receipt["logs"]
+            if len(log["topics"]) > 1
+            and log["topics"][0] == self._rate_updated_topic
+            and log["address"] == self.contract_address
+            and log["topics"][1] in self._rate_type_topics
+        }
+
+    def _landed_dates(self, receipt, new_dates: Dict[str, int]) -> Dict[str, int]:
+        """The subset of new_dates whose rates the receipt shows as updated."""
+        updated = self._updated_rate_types(receipt)
+        return {rt: d for rt, d in new_dates.items() if rt in updated}
+
+    async def _confirm_batch(
+        self, tx_hash, gas_key: Optional[Hashable], new_dates: Dict[str, int]
+    ) -> None:
+        """Wait for an unconfirmed batch in the background and log its outcome."""
+        try:
+            receipt = await self._wait_for_receipt(tx_hash, timeout=180)
+        except Exception as e:
+            logger.error(f"Batch TX {tx_hash.hex()} not confirmed: {e}")
+            self._forget_dates(list(new_dates))
+            return
+        self._record_gas(gas_key, receipt)
+        if receipt["status"] == 1:
+            logger.info(f"✓ Batch {tx_hash.hex()} confirmed - {len(self._updated_rate_types(receipt))} updated - Block: {receipt['blockNumber']}")
+            self._remember_dates(self._landed_dates(receipt, new_dates))
+        else:
+            logger.error(f"✗ Batch TX {tx_hash.hex()} reverted")
+            self._forget_dates(list(new_dates))
+
+    async def prepare_tx(
+        self,
+        force: bool = False,
+        rates: Optional[Dict[RateType, RateData]] = None
+    ) -> PreparedBatch:
+        """
+        Decide which rates need updating and build the batch transaction.
         
-        The contract's batchUpdateRates skips same-date updates without reverting.
+        Everything up to the broadcast except the nonce happens here
+        (on-chain snapshot, gas estimate, fees), so callers can overlap it
+        with unrelated work and then call submit_and_wait().
         
         Args:
             force: If True, send all rates (contract still skips same-date)
+            rates: Already-fetched BCB data (default: fetch all rates)
             
         Returns:
-            UpdateResult with counts of updated/skipped rates
+            PreparedBatch with the signed transaction, or with result set
+            when there is nothing to send
         """
-        async with BCBClient() as bcb:
-            rates = await bcb.fetch_all_latest()
-            
-            if not rates:
-                return UpdateResult(success=False, error="No rates fetched from BCB")
-            
-            # Pre-check which rates need updating (for logging)
-            to_update: List[RateData] = []
-            to_skip: List[Tuple[str, str]] = []
-            
-            for rate_data in rates.values():
-                needs_update, reason = await self.check_needs_update(rate_data)
-                if needs_update or force:
-                    to_update.append(rate_data)
+        await self._load_date_cache()
+        async with self._bcb_session() as bcb:
+            if rates is None and self._dates_trusted() and all(rt.value in self._date_cache for rt in RateType):
+                rates = await bcb.fetch_all_latest()
+            if rates is not None:
+                # Read the chain only if some BCB date is newer than the
+                # cached on-chain date
+                cached = {rt: self._cached_current(rd) for rt, rd in rates.items()}
+                if all(c is not None for c in cached.values()):
+                    current_rates = {rt.value: c for rt, c in cached.items()}
                 else:
-                    to_skip.append((rate_data.rate_type.value, reason))
+                    current_rates = await self.get_all_current_rates()
+            else:
+                # BCB fetch and on-chain snapshot are independent; overlap them
+                rates, current_rates = await asyncio.gather(
+                    bcb.fetch_all_latest(), self.get_all_current_rates()
+                )
+        
+        if not rates:
+            return PreparedBatch([], [], result=UpdateResult(success=False, error="No rates fetched from BCB"))
+        
+        # Pre-check which rates need updating (for logging)
+        to_update: List[RateData] = []
+        to_skip: List[RateData] = []
+        decide = self._decide_update
+        
+        for rate_data in rates.values():
+            current = current_rates.get(rate_data.rate_type.value)
+            decision = decide(current, rate_data)
+            if force or decision >= DECISION_NEW_DATE:
+                to_update.append(rate_data)
+            else:
+                to_skip.append(rate_data)
+                # Log what will be skipped (reasons are only formatted here)
+                reason = self._format_reason(decision, current, rate_data)
+                logger.info(f"⏭️  {rate_data.rate_type.value} skip: {reason}")
+        
+        if not to_update:
+            logger.info("✓ All rates up to date, nothing to sync")
+            return PreparedBatch(to_update, to_skip, result=UpdateResult(
+                success=True,
+                rates_updated=0,
+                rates_skipped=len(to_skip),
+                details={"skipped": [r.rate_type.value for r in to_skip]}
+            ))
+        
+        # Prepare batch data: struct-of-arrays columns for only the rates
+        # that passed the pre-check (all of them when forced)
+        rate_types: List[str] = [r.rate_type.value for r in to_update]
+        answers: List[int] = [r.answer for r in to_update]  # Already 8 decimals
+        dates: List[int] = [r.real_world_date for r in to_update]
+        sources: List[str] = [r.source for r in to_update]
+        
+        # Forced batches may include entries the contract skips, so their
+        # gas varies run to run: always estimate them (key None)
+        gas_key = None if force else ("batchUpdateRates", len(rate_types))
+        
+        try:
+            data = self._encode_call(
+                self._batch_spec, (rate_types, answers, dates, sources)
+            )
             
-            # Log what will be skipped
-            for rate_type, reason in to_skip:
-                logger.info(f"⏭️  {rate_type} skip: {reason}")
+            # Gas sizing doesn't depend on fees; issue all reads together
+            gas_limit, fees, chain_id = await asyncio.gather(
+                self._gas_limit(gas_key, data, 1.3),
+                self._get_fees(),
+                self._get_chain_id(),
+            )
             
-            if not to_update:
-                logger.info("✓ All rates up to date, nothing to sync")
-                return UpdateResult(
-                    success=True,
-                    rates_updated=0,
-                    rates_skipped=len(to_skip),
-                    details={"skipped": [s[0] for s in to_skip]}
-                )
+            tx = self._build_tx(data, None, gas_limit, chain_id, fees)
+            
+        except Exception as e:
+            logger.error(f"Batch update failed: {e}")
+            self._forget_dates(rate_types)
+            return PreparedBatch(to_update, to_skip, gas_key, result=UpdateResult(success=False, error=str(e)))
+        
+        return PreparedBatch(to_update, to_skip, gas_key, tx=tx)
+
+    async def submit_and_wait(self, prepared: PreparedBatch, confirm: bool = True) -> UpdateResult:
+        """
+        Broadcast a batch from prepare_tx() and wait for its receipt.
+        
+        Args:
+            prepared: Batch returned by prepare_tx()
+            confirm: If False, return right after the transaction is sent and
+                log the receipt from a background task (details["pending"])
             
-            # Prepare batch data (send all, let contract filter)
-            rate_types: List[str] = []
-            answers: List[int] = []
-            dates: List[int] = []
-            sources: List[str] = []
+        Returns:
+            UpdateResult with counts of updated/skipped rates
+        """
+        if prepared.result is not None:
+            return prepared.result
+        
+        to_update, to_skip, gas_key = prepared.to_update, prepared.to_skip, prepared.gas_key
+        rate_types = [r.rate_type.value for r in to_update]
+        skipped = [r.rate_type.value for r in to_skip]
+        
+        logger.info(f"Batch updating {len(to_update)} rates: {rate_types}")
+        
+        try:
+            nonce = await self.w3.eth.get_transaction_count(self.account.address)
+            tx = {**prepared.tx, "nonce": nonce}
+            signed_tx = await asyncio.to_thread(self.account.sign_transaction, tx)
+            tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
             
-            for rate_data in rates.values():
-                rate_types.append(rate_data.rate_type.value)
-                answers.append(rate_data.answer)  # Already 8 decimals
-                dates.append(rate_data.real_world_date)
-                sources.append(rate_data.source)
+            logger.info(f"Batch TX sent: {tx_hash.hex()}")
             
-            logger.info(f"Batch updating {len(to_update)} rates: {[r.rate_type.value for r in to_update]}")
+            # Dates the chain will hold once this batch lands (forced
+            # same/older entries are skipped by the contract)
+            new_dates = {
+                r.rate_type.value: r.real_world_date for r in to_update
+                if r.real_world_date > self._date_cache.get(r.rate_type.value, -1)
+            }
             
-            try:
-                nonce = await self.w3.eth.get_transaction_count(self.account.address)
-                gas_price = await self.w3.eth.gas_price
-                chain_id = await self.w3.eth.chain_id
-                
-                tx_data = self.contract.functions.batchUpdateRates(
-                    rate_types, answers, dates, sources
-                )
-                
-                gas_estimate = await tx_data.estimate_gas({"from": self.account.address})
-                gas_limit = int(gas_estimate * 1.3)
-                
-                tx = await tx_data.build_transaction({
-                    "from": self.account.address,
-                    "nonce": nonce,
-                    "gas": gas_limit,
-                    "gasPrice": gas_price,
-                    "chainId": chain_id
-                })
-                
-                signed_tx = self.w3.eth.account.sign_transaction(tx, self.private_key)
-                tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                
-                logger.info(f"Batch TX sent: {tx_hash.hex()}")
-                
-                receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=180)
-                
-                success = receipt["status"] == 1
-                
-                # Count RateUpdated events to know how many actually updated
-                rate_updated_events = [
-                    log for log in receipt["logs"] 
-                    if len(log["topics"]) > 0
-                ]
-                actual_updated = len(rate_updated_events)
-                
-                result = UpdateResult(
-                    success=success,
-                    rates_updated=len(to_update) if success else 0,
+            if not confirm:
+                task = asyncio.create_task(self._confirm_batch(tx_hash, gas_key, new_dates))
+                self._pending_receipts.add(task)
+                task.add_done_callback(self._pending_receipts.discard)
+                # Submitted, not confirmed: counts are what was sent
+                return UpdateResult(
+                    success=True,
+                    rates_updated=len(to_update),
                     rates_skipped=len(to_skip),
                     tx_hash=tx_hash.hex(),
-                    block=receipt["blockNumber"],
-                    gas_used=receipt["gasUsed"],
                     details={
-                        "updated": [r.rate_type.value for r in to_update],
-                        "skipped": [s[0] for s in to_skip],
+                        "pending": True,
+                        "updated": rate_types,
+                        "skipped": skipped,
                         "url": f"https://sepolia.arbiscan.io/tx/{tx_hash.hex()}"
                     }
                 )
-                
-                if success:
-                    logger.info(f"✓ Batch complete - {len(to_update)} updated, {len(to_skip)} skipped - Block: {receipt['blockNumber']}")
-                else:
-                    logger.error("✗ Batch TX reverted")
-                    result.error = "Transaction reverted"
-                
-                return result
-                
-            except Exception as e:
-                logger.error(f"Batch update failed: {e}")
-                return UpdateResult(success=False, error=str(e))
+            
+            receipt = await self._wait_for_receipt(tx_hash, timeout=180)
+            self._record_gas(gas_key, receipt)
+            
+            success = receipt["status"] == 1
+            actual_updated = len(self._updated_rate_types(receipt))
+            if success:
+                self._remember_dates(self._landed_dates(receipt, new_dates))
+            else:
+                self._forget_dates(rate_types)
+            
+            result = UpdateResult(
+                success=success,
+                rates_updated=actual_updated if success else 0,
+                rates_skipped=len(to_skip),
+                tx_hash=tx_hash.hex(),
+                block=receipt["blockNumber"],
+                gas_used=receipt["gasUsed"],
+                details={
+                    "updated": rate_types,
+                    "skipped": skipped,
+                    "url": f"https://sepolia.arbiscan.io/tx/{tx_hash.hex()}"
+                }
+            )
+            
+            if success:
+                logger.info(f"✓ Batch complete - {actual_updated} updated, {len(to_skip)} skipped - Block: {receipt['blockNumber']}")
+            else:
+                logger.error("✗ Batch TX reverted")
+                result.error = "Transaction reverted"
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Batch update failed: {e}")
+            self._forget_dates(rate_types)
+            return UpdateResult(success=False, error=str(e))
 
+    async def sync_all_rates(self, force: bool = False, confirm: bool = True) -> UpdateResult:
+        """
+        Fetch all rates from BCB and update oracle using batch function.
+        
+        Only rates with a newer BCB date than the on-chain snapshot are sent.
+        The contract's batchUpdateRates also skips same-date updates without
+        reverting, which covers forced sends.
+        
+        Args:
+            force: If True, send all rates (contract still skips same-date)
+            confirm: If False, return right after the transaction is sent and
+                log the receipt from a background task (details["pending"])
+            
+        Returns:
+            UpdateResult with counts of updated/skipped rates
+        """
+        prepared = await self.prepare_tx(force=force)
+        return await self.submit_and_wait(prepared, confirm=confirm)
 
 async def main():
     """CLI entry point."""
@@ -361,70 +1056,71 @@ async def main():
     parser.add_argument("--rate", "-r", type=str, help="Rate type for sync/check command")
     parser.add_argument("--force", "-f", action="store_true", help="Force update even if same date")
     args = parser.parse_args()
+
+    setup_logging(json_format=False)
+    async with OracleUpdater() as updater:
+        if not await updater.check_connection():
+            print("Failed to connect to blockchain")
+            return
     
-    updater = OracleUpdater()
-    
-    if not await updater.check_connection():
-        print("Failed to connect to blockchain")
-        return
-    
-    if args.command == "balance":
-        balance = await updater.get_balance()
-        print(f"Account: {updater.account.address}")
-        print(f"Balance: {balance:.6f} ETH")
-        
-    elif args.command == "status":
-        print("\n📊 Current Oracle Rates (8 decimals):")
-        print("-" * 70)
-        print(f"{'Rate':<6} | {'Answer (scaled)':<18} | {'Percent':>10} | {'Date':>10}")
-        print("-" * 70)
-        rates = await updater.get_all_current_rates()
-        for name, data in rates.items():
-            print(f"{name:<6} | {data['answer']:<18} | {data['value_percent']:>9.4f}% | {data['real_world_date']}")
-        
-    elif args.command == "check":
-        print("\n🔍 Checking for updates needed:")
-        print("-" * 60)
-        async with BCBClient() as bcb:
-            rates = await bcb.fetch_all_latest()
-            for rate_data in rates.values():
-                needs_update, reason = await updater.check_needs_update(rate_data)
+        if args.command == "balance":
+            balance = await updater.get_balance()
+            print(f"Account: {updater.account.address}")
+            print(f"Balance: {balance:.6f} ETH")
+        
+        elif args.command == "status":
+            print("\n📊 Current Oracle Rates (8 decimals):")
+            print("-" * 70)
+            print(f"{'Rate':<6} | {'Answer (scaled)':<18} | {'Percent':>10} | {'Date':>10}")
+            print("-" * 70)
+            rates = await updater.get_all_current_rates()
+            for name, data in rates.items():
+                print(f"{name:<6} | {data['answer']:<18} | {data['value_percent']:>9.4f}% | {data['real_world_date']}")
+        
+        elif args.command == "check":
+            print("\n🔍 Checking for updates needed:")
+            print("-" * 60)
+            rates, current_rates = await asyncio.gather(
+                updater.bcb.fetch_all_latest(), updater.get_all_current_rates()
+            )
+            checks = await updater.check_all_needs_update(rates, current_rates)
+            for rate_type, (needs_update, reason) in checks.items():
                 status = "🔄 UPDATE" if needs_update else "✓ CURRENT"
-                print(f"{rate_data.rate_type.value:<6}: {status} ({reason})")
+                print(f"{rate_type:<6}: {status} ({reason})")
         
-    elif args.command == "sync":
-        if not args.rate:
-            print("Error: --rate required for sync command")
-            return
-        try:
-            rate_type = RateType(args.rate.upper())
-        except ValueError:
-            print(f"Error: Invalid rate type. Choose from: {[r.value for r in RateType]}")
-            return
-        result = await updater.sync_rate(rate_type, force=args.force)
-        print(json.dumps({
-            "success": result.success,
-            "rates_updated": result.rates_updated,
-            "rates_skipped": result.rates_skipped,
-            "tx_hash": result.tx_hash,
-            "block": result.block,
-            "gas_used": result.gas_used,
-            "error": result.error,
-            "details": result.details
-        }, indent=2))
-        
-    elif args.command == "sync-all":
-        result = await updater.sync_all_rates(force=args.force)
-        print(json.dumps({
-            "success": result.success,
-            "rates_updated": result.rates_updated,
-            "rates_skipped": result.rates_skipped,
-            "tx_hash": result.tx_hash,
-            "block": result.block,
-            "gas_used": result.gas_used,
-            "error": result.error,
-            "details": result.details
-        }, indent=2))
+        elif args.command == "sync":
+            if not args.rate:
+                print("Error: --rate required for sync command")
+                return
+            try:
+                rate_type = RateType(args.rate.upper())
+            except ValueError:
+                print(f"Error: Invalid rate type. Choose from: {[r.value for r in RateType]}")
+                return
+            result = await updater.sync_rate(rate_type, force=args.force)
+            print(json.dumps({
+                "success": result.success,
+                "rates_updated": result.rates_updated,
+                "rates_skipped": result.rates_skipped,
+                "tx_hash": result.tx_hash,
+                "block": result.block,
+                "gas_used": result.gas_used,
+                "error": result.error,
+                "details": result.details
+            }, indent=2))
+        
+        elif args.command == "sync-all":
+            result = await updater.sync_all_rates(force=args.force)
+            print(json.dumps({
+                "success": result.success,
+                "rates_updated": result.rates_updated,
+                "rates_skipped": result.rates_skipped,
+                "tx_hash": result.tx_hash,
+                "block": result.block,
+                "gas_used": result.gas_used,
+                "error": result.error,
+                "details": result.details
+            }, indent=2))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 """
 DELOS Rate Update Scheduler
-Automated BCB data fetching and oracle updates using APScheduler.
+Automated BCB data fetching and oracle updates using asyncio cron timers.
 
 Schedule:
 - Daily rates (CDI, SELIC, PTAX, TR): 19:00 BRT (22:00 UTC) on business days
@@ -21,26 +21,28 @@ Usage:
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import signal
+import sys
+import time
+from datetime import datetime, date, timedelta
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Any, Set, Tuple
 from zoneinfo import ZoneInfo
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.events import (
-    EVENT_JOB_ERROR,
-    EVENT_JOB_EXECUTED,
-    EVENT_JOB_MISSED,
-    JobExecutionEvent
-)
+import httpx
 
 from bcb_client import BCBClient, RateType, RateData, BCBClientError, RATE_CONFIGS
-from oracle_updater import OracleUpdater, UpdateResult
 from services.data_store import DataStore
-from services.anomaly_detector import AnomalyDetector
-from config import Settings
+from services.anomaly_detector import AnomalyDetector, RollingStats
+from services.asyncio_cron import CronScheduler, CronTrigger
+from services.response_cache import ResponseCache
+from config import Settings, get_settings
 from logging_config import setup_logging, get_logger
 
+# oracle_updater pulls in web3 (~1s to import); it is loaded on first use
+# so `status`/`--help` start quickly
+if TYPE_CHECKING:
+    from oracle_updater import UpdateResult
+
 logger = get_logger(__name__)
 
 # Brazil timezone
@@ -50,6 +52,18 @@ BRT = ZoneInfo("America/Sao_Paulo")
 DAILY_RATES = [RateType.CDI, RateType.SELIC, RateType.PTAX, RateType.TR]
 MONTHLY_RATES = [RateType.IPCA, RateType.IGPM]
 
+# Enum value/lookup tables, built once instead of per rate per run
+_RT_VALUE = {rt: rt.value for rt in RateType}
+_HEARTBEAT_SECONDS = {rt.value: RATE_CONFIGS[rt].heartbeat_seconds for rt in RateType}
+
+# Slack webhook calls must not hold up shutdown for long
+ALERT_TIMEOUT = 10.0
+
+# Anomaly-detection history (and its running statistics) is cached per
+# (rate, lookback, day) and kept in step with store_rate, so repeat runs
+# skip both the SQLite scan and the statistics pass
+HISTORY_CACHE_TTL = 3600
+
 
 class RateScheduler:
     """
@@ -69,6 +83,7 @@ class RateScheduler:
         settings: Optional[Settings] = None,
         data_store: Optional[DataStore] = None,
         anomaly_detector: Optional[AnomalyDetector] = None,
+        on_rates_updated: Optional[Callable[[], None]] = None,
     ):
         """
         Initialize scheduler.
@@ -77,8 +92,10 @@ class RateScheduler:
             settings: Application settings
             data_store: Data persistence layer
             anomaly_detector: Anomaly detection service
+            on_rates_updated: Called whenever an update run has stored rates
+                or finished its oracle update (e.g. to drop cached responses)
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
         self.data_store = data_store or DataStore(self.settings.database_path)
         self.anomaly_detector = anomaly_detector or AnomalyDetector(
             std_threshold=self.settings.anomaly_std_threshold,
@@ -86,13 +103,40 @@ class RateScheduler:
             velocity_threshold=self.settings.anomaly_velocity_threshold,
         )
 
-        self.scheduler = AsyncIOScheduler(timezone=BRT)
-        self.is_running = False
+        # One BCB client (and keep-alive pool) for the scheduler's lifetime,
+        # shared with the oracle updater and the stale check
+        self.bcb = BCBClient(
+            timeout=self.settings.bcb_api_timeout,
+            max_retries=self.settings.bcb_max_retries,
+            retry_base_delay=self.settings.bcb_retry_base_delay,
+            retry_max_delay=self.settings.bcb_retry_max_delay,
+        )
 
-        # Setup event listeners
-        self.scheduler.add_listener(self._on_job_executed, EVENT_JOB_EXECUTED)
-        self.scheduler.add_listener(self._on_job_error, EVENT_JOB_ERROR)
-        self.scheduler.add_listener(self._on_job_missed, EVENT_JOB_MISSED)
+        self.scheduler = CronScheduler(
+            on_executed=self._on_job_executed,
+            on_error=self._on_job_error,
+            on_missed=self._on_job_missed,
+        )
+        self.is_running = False
+        self.on_rates_updated = on_rates_updated
+        # ((real_world_date, raw_value) history most recent first, RollingStats)
+        # per rate
+        self._history_cache = ResponseCache()
+        self._history_hits = 0
+        self._history_misses = 0
+
+        # SQLite allows one writer at a time; concurrent update jobs
+        # take this around writes instead of contending for the file lock
+        self._write_lock = asyncio.Lock()
+
+        # job_id -> started_at for runs in progress; the run is written to
+        # scheduler_runs once, when it finishes
+        self._in_flight: Dict[str, datetime] = {}
+
+        # Alerts are sent from background tasks so a slow channel never
+        # delays a job; the webhook client is created on first use
+        self._alert_tasks: Set[asyncio.Task] = set()
+        self._alert_client: Optional[httpx.AsyncClient] = None
 
     def setup_jobs(self) -> None:
         """Configure scheduled jobs."""
@@ -108,9 +152,6 @@ class RateScheduler:
             ),
             id="daily_rates",
             name="Daily Rate Update (CDI, SELIC, PTAX, TR)",
-            replace_existing=True,
-            max_instances=1,
-            coalesce=True,
             misfire_grace_time=3600  # 1 hour grace period
         )
 
@@ -125,9 +166,6 @@ class RateScheduler:
             ),
             id="monthly_rates",
             name="Monthly Rate Update (IPCA, IGPM)",
-            replace_existing=True,
-            max_instances=1,
-            coalesce=True,
             misfire_grace_time=86400  # 24 hour grace period
         )
 
@@ -136,9 +174,7 @@ class RateScheduler:
             self.check_stale_rates,
             CronTrigger(hour="*/4", timezone=BRT),
             id="stale_check",
-            name="Stale Data Check",
-            replace_existing=True,
-            max_instances=1
+            name="Stale Data Check"
         )
 
         logger.info("Scheduler jobs configured")
@@ -155,6 +191,168 @@ class RateScheduler:
         """Update all rates (manual trigger)."""
         return await self._update_rates(list(RateType), "all")
 
+    def _history_key(self, rate_type: RateType) -> Tuple[str, int, date]:
+        """Cache key for a rate's anomaly-detection history."""
+        return (_RT_VALUE[rate_type], self.settings.anomaly_lookback_days, date.today())
+
+    async def _get_history(
+        self, rate_type: RateType
+    ) -> Tuple[List[Tuple[int, float]], RollingStats]:
+        """
+        Get (real_world_date, raw_value) history and its statistics.
+
+        Served from the in-process cache when possible; the lookback window
+        is keyed by day so entries never outlive the date they were read.
+        """
+        key = self._history_key(rate_type)
+        entry = self._history_cache.get("history", key)
+        if entry is not None:
+            self._history_hits += 1
+            return entry
+
+        self._history_misses += 1
+        rows = await self.data_store.get_rate_history_rows(
+            _RT_VALUE[rate_type],
+            days=self.settings.anomaly_lookback_days
+        )
+        history = [(row[2], row[1]) for row in rows]
+        entry = (history, RollingStats(value for _, value in history))
+        self._history_cache.set("history", key, entry, HISTORY_CACHE_TTL)
+        return entry
+
+    async def _prefetch_histories(self, rate_types: List[RateType]) -> None:
+        """Load every uncached history among rate_types with a single query."""
+        missing = [
+            rate_type for rate_type in rate_types
+            if self._history_cache.get("history", self._history_key(rate_type)) is None
+        ]
+        if not missing:
+            return
+
+        self._history_misses += len(missing)
+        histories = await self.data_store.get_rate_histories(
+            [_RT_VALUE[rate_type] for rate_type in missing],
+            days=self.settings.anomaly_lookback_days
+        )
+        for rate_type in missing:
+            history = histories[_RT_VALUE[rate_type]]
+            entry = (history, RollingStats(value for _, value in history))
+            self._history_cache.set("history", self._history_key(rate_type), entry, HISTORY_CACHE_TTL)
+
+    def _remember_stored(self, rate_data: RateData) -> None:
+        """
+        Apply a store_rate to the cached history (replace same date or insert),
+        updating its statistics in O(1).
+        """
+        key = self._history_key(rate_data.rate_type)
+        entry = self._history_cache.get("history", key)
+        if entry is None:
+            return
+        history, stats = entry
+        updated = []
+        for entry_date, value in history:
+            if entry_date == rate_data.real_world_date:
+                stats.remove(value)
+            else:
+                updated.append((entry_date, value))
+        updated.append((rate_data.real_world_date, rate_data.raw_value))
+        updated.sort(reverse=True)
+        stats.add(rate_data.raw_value)
+        self._history_cache.set("history", key, (updated, stats), HISTORY_CACHE_TTL)
+
+    def history_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for the anomaly-detection history cache."""
+        return {"hits": self._history_hits, "misses": self._history_misses}
+
+    async def _process_rate(
+        self, rate_type: RateType, rate_data: RateData
+    ) -> Optional[Tuple[str, str, float, float, float, float, str]]:
+        """
+        Run anomaly detection for a fetched rate (storing is batched by the caller).
+
+        Args:
+            rate_type: Rate being processed
+            rate_data: Freshly fetched BCB data
+
+        Returns:
+            Anomaly row for DataStore.store_rates_with_anomalies, or None
+        """
+        # Get historical statistics for anomaly detection
+        history, stats = await self._get_history(rate_type)
+
+        anomaly_row = None
+        rate_type_str = _RT_VALUE[rate_type]
+
+        # Run anomaly checks
+        anomaly_result = None
+        if stats.count and self.settings.anomaly_method == "hampel":
+            anomaly_result = self.anomaly_detector.detect_hampel_anomaly(
+                rate_data.raw_value,
+                [value for _, value in history]
+            )
+        elif stats.count and self.anomaly_detector.is_value_anomaly(
+            rate_data.raw_value, stats.mean, stats.std_dev, stats.count
+        ):
+            # Only build the full result (and message) for an actual hit
+            anomaly_result = self.anomaly_detector.detect_with_stats(
+                rate_data.raw_value,
+                stats.mean,
+                stats.std_dev,
+                stats.count
+            )
+
+        if anomaly_result is not None and anomaly_result.is_anomaly:
+            logger.warning(
+                "Anomaly detected for %s: %s", rate_type_str, anomaly_result.message,
+                extra={
+                    "rate_type": rate_type_str,
+                    "anomaly_type": anomaly_result.anomaly_type,
+                    "z_score": anomaly_result.z_score
+                }
+            )
+            band = anomaly_result.std_dev * self.settings.anomaly_std_threshold
+            anomaly_row = (
+                rate_type_str,
+                anomaly_result.anomaly_type,
+                rate_data.raw_value,
+                anomaly_result.mean - band,
+                anomaly_result.mean + band,
+                anomaly_result.z_score,
+                anomaly_result.message
+            )
+            # Note: We log but DON'T block the update
+
+        return anomaly_row
+
+    async def _sync_oracle(
+        self, rates: Dict[RateType, RateData], stored: asyncio.Event
+    ) -> "UpdateResult":
+        """
+        Prepare the batch transaction, then submit it once rates are stored.
+
+        Args:
+            rates: The rates this job fetched (only these are sent)
+            stored: Set by _update_rates when the store phase has finished
+
+        Returns:
+            UpdateResult from the oracle
+        """
+        from oracle_updater import OracleUpdater
+
+        async with OracleUpdater(bcb=self.bcb) as updater:
+            prepared = await updater.prepare_tx(rates=rates)
+            await stored.wait()
+            return await updater.submit_and_wait(prepared)
+
+    def _notify_rates_updated(self) -> None:
+        """Run the on_rates_updated hook (its failures never fail the job)."""
+        if self.on_rates_updated is None:
+            return
+        try:
+            self.on_rates_updated()
+        except Exception as e:
+            logger.warning("on_rates_updated hook failed: %s", e)
+
     async def _update_rates(
         self,
         rate_types: List[RateType],
@@ -170,7 +368,14 @@ class RateScheduler:
         Returns:
             Dictionary with update results
         """
+        # Wall clock is read once; end time and duration come from the
+        # monotonic clock so ended_at - started_at always equals duration_ms
         job_start = datetime.now()
+        t0 = time.perf_counter_ns()
+
+        def job_end() -> Tuple[datetime, float]:
+            duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
+            return job_start + timedelta(milliseconds=duration_ms), duration_ms
         results = {
             "success": False,
             "rates_updated": 0,
@@ -181,91 +386,79 @@ class RateScheduler:
             "error": None,
         }
 
+        job_id = f"{update_type}_rates"
+
         logger.info(
-            f"Starting {update_type} rate update",
-            extra={"rate_types": [r.value for r in rate_types], "job_id": f"{update_type}_rates"}
+            "Starting %s rate update", update_type,
+            extra={"rate_types": [_RT_VALUE[r] for r in rate_types], "job_id": job_id}
         )
 
-        # Log job start
-        await self.data_store.log_scheduler_run(
-            job_id=f"{update_type}_rates",
-            started_at=job_start,
-            status="running"
-        )
+        self._in_flight[job_id] = job_start
 
         try:
-            # Fetch rates with parallel fetching and retry
-            async with BCBClient() as bcb:
-                fetched_rates: Dict[RateType, RateData] = {}
-
-                for rate_type in rate_types:
-                    try:
-                        rate_data = await bcb.fetch_with_retry(
-                            rate_type,
-                            max_retries=self.settings.bcb_max_retries,
-                            base_delay=self.settings.bcb_retry_base_delay,
-                            max_delay=self.settings.bcb_retry_max_delay,
-                        )
-                        fetched_rates[rate_type] = rate_data
-                    except BCBClientError as e:
-                        logger.error(f"Failed to fetch {rate_type.value} after retries: {e}")
-                        results["rates_failed"] += 1
+            # Fetch all rates concurrently over the scheduler's shared pool.
+            # Transient failures are retried inside the client with backoff + jitter
+            fetched_rates: Dict[RateType, RateData] = {}
+            fetch_results = await asyncio.gather(
+                *[self.bcb.fetch_latest(rate_type) for rate_type in rate_types],
+                return_exceptions=True
+            )
+
+            for rate_type, fetch_result in zip(rate_types, fetch_results):
+                if isinstance(fetch_result, BCBClientError):
+                    logger.error("Failed to fetch %s after retries: %s", _RT_VALUE[rate_type], fetch_result)
+                    results["rates_failed"] += 1
+                elif isinstance(fetch_result, BaseException):
+                    raise fetch_result
+                else:
+                    fetched_rates[rate_type] = fetch_result
 
             if not fetched_rates:
                 error_msg = "No rates fetched from BCB"
                 results["error"] = error_msg
-                await self.data_store.update_scheduler_run(
-                    job_id=f"{update_type}_rates",
-                    ended_at=datetime.now(),
+                await self.data_store.record_scheduler_run(
+                    job_id=job_id,
+                    started_at=job_start,
+                    ended_at=job_end()[0],
                     status="failed",
                     error_message=error_msg
                 )
                 return results
 
-            # Check for anomalies and store rates
-            for rate_type, rate_data in fetched_rates.items():
-                # Get historical data for anomaly detection
-                history = await self.data_store.get_rate_history(
-                    rate_type.value,
-                    days=self.settings.anomaly_lookback_days
-                )
-                historical_values = [r.raw_value for r in history]
+            # Prepare the oracle transaction (snapshot, gas, fees) while
+            # rates are checked and stored; it is signed with a fresh nonce
+            # and broadcast once the store phase is done
+            stored = asyncio.Event()
+            oracle_task = asyncio.create_task(self._sync_oracle(dict(fetched_rates), stored))
 
-                # Run anomaly checks
-                if historical_values:
-                    anomaly_result = self.anomaly_detector.detect_value_anomaly(
-                        rate_data.raw_value,
-                        historical_values
+            # Check for anomalies (one coroutine per rate so history reads
+            # overlap), then store rates and anomalies in one transaction each
+            try:
+                await self._prefetch_histories(list(fetched_rates))
+                anomaly_rows = await asyncio.gather(*[
+                    self._process_rate(rate_type, rate_data)
+                    for rate_type, rate_data in fetched_rates.items()
+                ])
+                anomaly_rows = [row for row in anomaly_rows if row is not None]
+                results["anomalies_detected"] += len(anomaly_rows)
+                async with self._write_lock:
+                    await self.data_store.store_rates_with_anomalies(
+                        list(fetched_rates.values()), anomaly_rows
                     )
-
-                    if anomaly_result.is_anomaly:
-                        results["anomalies_detected"] += 1
-                        logger.warning(
-                            f"Anomaly detected for {rate_type.value}: {anomaly_result.message}",
-                            extra={
-                                "rate_type": rate_type.value,
-                                "anomaly_type": anomaly_result.anomaly_type,
-                                "z_score": anomaly_result.z_score
-                            }
-                        )
-                        await self.data_store.log_anomaly(
-                            rate_type=rate_type.value,
-                            anomaly_type=anomaly_result.anomaly_type,
-                            current_value=rate_data.raw_value,
-                            expected_low=anomaly_result.mean - (anomaly_result.std_dev * self.settings.anomaly_std_threshold),
-                            expected_high=anomaly_result.mean + (anomaly_result.std_dev * self.settings.anomaly_std_threshold),
-                            std_devs=anomaly_result.z_score,
-                            message=anomaly_result.message
-                        )
-                        # Note: We log but DON'T block the update
-
-                # Store rate in local database
-                await self.data_store.store_rate(rate_data)
+                for rate_data in fetched_rates.values():
+                    self._remember_stored(rate_data)
+            except BaseException:
+                oracle_task.cancel()
+                # Reap the task: if it had already failed, cancel() is a no-op
+                # and its exception would otherwise never be retrieved
+                await asyncio.gather(oracle_task, return_exceptions=True)
+                raise
+            stored.set()
+            self._notify_rates_updated()
 
             # Update oracle
             try:
-                updater = OracleUpdater()
-                oracle_result = await updater.sync_all_rates()
+                oracle_result = await oracle_task
 
                 results["success"] = oracle_result.success
                 results["rates_updated"] = oracle_result.rates_updated
@@ -275,37 +468,32 @@ class RateScheduler:
                 if oracle_result.error:
                     results["error"] = oracle_result.error
 
-                # Log individual oracle updates
-                for rate_type in fetched_rates.keys():
-                    await self.data_store.log_oracle_update(
-                        rate_type=rate_type.value,
-                        tx_hash=oracle_result.tx_hash,
-                        block_number=oracle_result.block,
-                        gas_used=oracle_result.gas_used,
-                        status="success" if oracle_result.success else "failed",
-                        error_message=oracle_result.error
-                    )
+                # Log per-rate oracle updates in one transaction
+                status = "success" if oracle_result.success else "failed"
+                await self.data_store.log_oracle_updates_batch([
+                    (_RT_VALUE[rate_type], oracle_result.tx_hash, oracle_result.block,
+                     oracle_result.gas_used, status, oracle_result.error)
+                    for rate_type in fetched_rates
+                ])
 
             except Exception as e:
-                logger.error(f"Oracle update failed: {e}")
+                logger.error("Oracle update failed: %s", e)
                 results["error"] = str(e)
 
                 # Log failed oracle updates
-                for rate_type in fetched_rates.keys():
-                    await self.data_store.log_oracle_update(
-                        rate_type=rate_type.value,
-                        tx_hash=None,
-                        block_number=None,
-                        gas_used=None,
-                        status="failed",
-                        error_message=str(e)
-                    )
+                await self.data_store.log_oracle_updates_batch([
+                    (_RT_VALUE[rate_type], None, None, None, "failed", str(e))
+                    for rate_type in fetched_rates
+                ])
+            # On-chain rates may have changed as well
+            self._notify_rates_updated()
 
             # Log job completion
-            duration_ms = (datetime.now() - job_start).total_seconds() * 1000
-            await self.data_store.update_scheduler_run(
-                job_id=f"{update_type}_rates",
-                ended_at=datetime.now(),
+            ended_at, duration_ms = job_end()
+            await self.data_store.record_scheduler_run(
+                job_id=job_id,
+                started_at=job_start,
+                ended_at=ended_at,
                 status="completed" if results["success"] else "failed",
                 rates_processed=len(rate_types),
                 rates_updated=results["rates_updated"],
@@ -313,31 +501,65 @@ class RateScheduler:
             )
 
             logger.info(
-                f"Completed {update_type} rate update: "
-                f"{results['rates_updated']} updated, "
-                f"{results['rates_skipped']} skipped, "
-                f"{results['rates_failed']} failed, "
-                f"{results['anomalies_detected']} anomalies",
+                "Completed %s rate update: %d updated, %d skipped, %d failed, %d anomalies",
+                update_type,
+                results["rates_updated"],
+                results["rates_skipped"],
+                results["rates_failed"],
+                results["anomalies_detected"],
                 extra={
                     "tx_hash": results["tx_hash"],
                     "duration_ms": duration_ms,
-                    "job_id": f"{update_type}_rates"
+                    "job_id": job_id
                 }
             )
 
         except Exception as e:
-            logger.error(f"{update_type} rate update failed: {e}", exc_info=True)
+            logger.error("%s rate update failed: %s", update_type, e, exc_info=True)
             results["error"] = str(e)
-            await self.data_store.update_scheduler_run(
-                job_id=f"{update_type}_rates",
-                ended_at=datetime.now(),
+            await self.data_store.record_scheduler_run(
+                job_id=job_id,
+                started_at=job_start,
+                ended_at=job_end()[0],
                 status="failed",
                 error_message=str(e)
             )
-            await self._send_alert(f"{update_type.title()} rate update failed: {e}")
+            self._alert(f"{update_type.title()} rate update failed: {e}")
+
+        finally:
+            self._in_flight.pop(job_id, None)
 
         return results
 
+    async def _update_rates_and_record(
+        self,
+        rate_types: List[RateType],
+        update_type: str,
+        job_id: int
+    ) -> Dict[str, Any]:
+        """
+        Run an update and record its outcome on a sync job.
+
+        Used for manual syncs that run in the background after the API
+        has already responded with the job ID.
+
+        Args:
+            rate_types: List of rates to update
+            update_type: Label for logging (e.g., 'manual')
+            job_id: Sync job ID from DataStore.create_sync_job
+
+        Returns:
+            Dictionary with update results
+        """
+        try:
+            results = await self._update_rates(rate_types, update_type)
+        except Exception as e:
+            logger.error("Sync job %s failed: %s", job_id, e, exc_info=True)
+            results = {"success": False, "error": str(e)}
+
+        await self.data_store.complete_sync_job(job_id, results)
+        return results
+
     async def check_stale_rates(self) -> Dict[str, bool]:
         """
         Check for stale data and log alerts.
@@ -348,33 +570,41 @@ class RateScheduler:
         stale_rates = {}
 
         try:
-            updater = OracleUpdater()
-            rates = await updater.get_all_current_rates()
+            from oracle_updater import OracleUpdater
 
-            for rate_type_str, rate_data in rates.items():
-                rate_type = RateType(rate_type_str)
-                config = RATE_CONFIGS[rate_type]
+            # Single multicall snapshot of every rate
+            async with OracleUpdater(bcb=self.bcb) as updater:
+                rates = await updater.get_all_current_rates()
 
+            now = datetime.now()
+            for rate_type_str, rate_data in rates.items():
                 last_update = datetime.fromtimestamp(rate_data["timestamp"])
                 anomaly = self.anomaly_detector.detect_stale_data(
                     last_update,
-                    config.heartbeat_seconds
+                    _HEARTBEAT_SECONDS[rate_type_str],
+                    now=now
                 )
 
                 stale_rates[rate_type_str] = anomaly.is_anomaly
 
                 if anomaly.is_anomaly:
                     logger.warning(
-                        f"Stale data detected: {rate_type_str} - {anomaly.message}",
+                        "Stale data detected: %s - %s", rate_type_str, anomaly.message,
                         extra={"rate_type": rate_type_str, "anomaly_type": "stale_data"}
                     )
-                    await self._send_alert(f"Stale rate: {rate_type_str} - {anomaly.message}")
+                    self._alert(f"Stale rate: {rate_type_str} - {anomaly.message}")
 
         except Exception as e:
-            logger.error(f"Stale rate check failed: {e}")
+            logger.error("Stale rate check failed: %s", e)
 
         return stale_rates
 
+    def _alert(self, message: str) -> None:
+        """Send an alert in the background (awaited on stop)."""
+        task = asyncio.create_task(self._send_alert(message))
+        self._alert_tasks.add(task)
+        task.add_done_callback(self._alert_tasks.discard)
+
     async def _send_alert(self, message: str) -> None:
         """
         Send alert via configured channels.
@@ -382,39 +612,54 @@ class RateScheduler:
         Args:
             message: Alert message
         """
-        # For now, just log as critical
-        # Future: Add Slack, email, PagerDuty integration
-        logger.critical(f"ALERT: {message}")
+        logger.critical("ALERT: %s", message)
 
         if self.settings.slack_webhook_url:
-            # TODO: Implement Slack notification
-            pass
-
-    def _on_job_executed(self, event: JobExecutionEvent) -> None:
+            if self._alert_client is None:
+                self._alert_client = httpx.AsyncClient(timeout=ALERT_TIMEOUT)
+            try:
+                response = await self._alert_client.post(
+                    self.settings.slack_webhook_url,
+                    json={"text": f"DELOS alert: {message}"}
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error("Slack alert failed: %s", e)
+
+    async def _close_alerts(self) -> None:
+        """Wait for pending alerts, then close the webhook client."""
+        if self._alert_tasks:
+            await asyncio.gather(*self._alert_tasks, return_exceptions=True)
+        if self._alert_client is not None:
+            await self._alert_client.aclose()
+            self._alert_client = None
+
+    def _on_job_executed(self, job_id: str) -> None:
         """Handle successful job execution."""
         logger.info(
-            f"Job {event.job_id} executed successfully",
-            extra={"job_id": event.job_id}
+            "Job %s executed successfully", job_id,
+            extra={"job_id": job_id}
         )
 
-    def _on_job_error(self, event: JobExecutionEvent) -> None:
+    def _on_job_error(self, job_id: str, exception: BaseException) -> None:
         """Handle job execution error."""
         logger.error(
-            f"Job {event.job_id} failed: {event.exception}",
-            extra={"job_id": event.job_id},
-            exc_info=event.exception
+            "Job %s failed: %s", job_id, exception,
+            extra={"job_id": job_id},
+            exc_info=exception
         )
 
-    def _on_job_missed(self, event: JobExecutionEvent) -> None:
+    def _on_job_missed(self, job_id: str) -> None:
         """Handle missed job execution."""
         logger.warning(
-            f"Job {event.job_id} missed scheduled run",
-            extra={"job_id": event.job_id}
+            "Job %s missed scheduled run", job_id,
+            extra={"job_id": job_id}
         )
 
     async def start(self) -> None:
         """Start the scheduler."""
         await self.data_store.initialize()
+        await self.bcb.__aenter__()
         self.setup_jobs()
         self.scheduler.start()
         self.is_running = True
@@ -422,10 +667,19 @@ class RateScheduler:
 
     async def stop(self) -> None:
         """Gracefully stop the scheduler."""
-        self.scheduler.shutdown(wait=True)
+        await self.scheduler.shutdown(wait=True)
+        await self._close_alerts()
+        await self.bcb.close()
         self.is_running = False
         logger.info("Scheduler stopped")
 
+    def get_running(self) -> List[Dict[str, str]]:
+        """Get update runs currently in progress (not yet in scheduler_runs)."""
+        return [
+            {"job_id": job_id, "started_at": started_at.isoformat()}
+            for job_id, started_at in self._in_flight.items()
+        ]
+
     def get_jobs(self) -> List[Dict[str, Any]]:
         """Get all scheduled jobs."""
         return [
@@ -439,6 +693,15 @@ class RateScheduler:
         ]
 
 
+def _print_json(obj: Any) -> None:
+    """Write obj to stdout as indented JSON (CLI --json output)."""
+    import orjson  # CLI-only; the daemon never serializes to stdout
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
+
+
 async def main():
     """CLI entry point for scheduler."""
     import argparse
@@ -466,65 +729,79 @@ async def main():
 
     scheduler = RateScheduler()
 
-    if args.command == "start":
-        await scheduler.start()
-        print("Scheduler started. Press Ctrl+C to stop.")
-        try:
-            # Keep running
-            while True:
-                await asyncio.sleep(60)
-        except KeyboardInterrupt:
-            print("\nShutting down...")
-            await scheduler.stop()
-
-    elif args.command == "run-once":
-        await scheduler.data_store.initialize()
-
-        # Parse rate types if provided
-        rate_types = None
-        if args.rates:
+    try:
+        if args.command == "start":
+            await scheduler.start()
+            print("Scheduler started. Press Ctrl+C to stop.")
+
+            # Sleep until SIGINT/SIGTERM instead of polling
+            stop_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, stop_event.set)
+                except NotImplementedError:
+                    pass  # Windows: Ctrl+C cancels the wait instead
             try:
-                rate_types = [RateType(r.strip().upper()) for r in args.rates.split(",")]
-            except ValueError as e:
-                print(f"Error: Invalid rate type. Valid types: {[r.value for r in RateType]}")
-                return
-
-        if rate_types:
-            results = await scheduler._update_rates(rate_types, "manual")
-        else:
-            results = await scheduler.update_all_rates()
-
-        if args.json:
-            import json
-            print(json.dumps(results, indent=2))
-        else:
-            print(f"\nUpdate Results:")
-            print(f"  Success: {results['success']}")
-            print(f"  Rates Updated: {results['rates_updated']}")
-            print(f"  Rates Skipped: {results['rates_skipped']}")
-            print(f"  Rates Failed: {results['rates_failed']}")
-            print(f"  Anomalies: {results['anomalies_detected']}")
-            if results['tx_hash']:
-                print(f"  TX Hash: {results['tx_hash']}")
-            if results['error']:
-                print(f"  Error: {results['error']}")
-
-    elif args.command == "status":
-        await scheduler.start()
-        jobs = scheduler.get_jobs()
-
-        if args.json:
-            import json
-            print(json.dumps(jobs, indent=2))
-        else:
-            print("\nScheduled Jobs:")
-            print("-" * 60)
-            for job in jobs:
-                print(f"\n{job['id']}: {job['name']}")
-                print(f"  Next run: {job['next_run']}")
-                print(f"  Trigger: {job['trigger']}")
-
-        await scheduler.stop()
+                await stop_event.wait()
+            finally:
+                print("\nShutting down...")
+                await scheduler.stop()
+
+        elif args.command == "run-once":
+            await scheduler.data_store.initialize()
+
+            # Parse rate types if provided
+            rate_types = None
+            if args.rates:
+                try:
+                    rate_types = [RateType(r.strip().upper()) for r in args.rates.split(",")]
+                except ValueError as e:
+                    print(f"Error: Invalid rate type. Valid types: {[r.value for r in RateType]}")
+                    return
+
+            if rate_types:
+                results = await scheduler._update_rates(rate_types, "manual")
+            else:
+                results = await scheduler.update_all_rates()
+
+            if args.json:
+                _print_json(results)
+            else:
+                print(f"\nUpdate Results:")
+                print(f"  Success: {results['success']}")
+                print(f"  Rates Updated: {results['rates_updated']}")
+                print(f"  Rates Skipped: {results['rates_skipped']}")
+                print(f"  Rates Failed: {results['rates_failed']}")
+                print(f"  Anomalies: {results['anomalies_detected']}")
+                if results['tx_hash']:
+                    print(f"  TX Hash: {results['tx_hash']}")
+                if results['error']:
+                    print(f"  Error: {results['error']}")
+
+        elif args.command == "status":
+            await scheduler.start()
+            jobs = scheduler.get_jobs()
+
+            cache_stats = scheduler.history_cache_stats()
+
+            if args.json:
+                _print_json({"jobs": jobs, "history_cache": cache_stats})
+            else:
+                print("\nScheduled Jobs:")
+                print("-" * 60)
+                for job in jobs:
+                    print(f"\n{job['id']}: {job['name']}")
+                    print(f"  Next run: {job['next_run']}")
+                    print(f"  Trigger: {job['trigger']}")
+                print(f"\nHistory cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
+            await scheduler.stop()
+    finally:
+        await scheduler._close_alerts()
+        # Pooled SQLite connections run on non-daemon threads
+        await scheduler.data_store.close()
+        await scheduler.bcb.close()
 
 
 if __name__ == "__main__":
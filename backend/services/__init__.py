@@ -3,8 +3,10 @@ DELOS Backend Services
 Data storage, anomaly detection, and utility services.
 """
 
-from .data_store import DataStore, StoredRate, OracleUpdate, Anomaly, SchedulerRun
-from .anomaly_detector import AnomalyDetector, AnomalyResult
+from .data_store import DataStore, StoredRate, OracleUpdate, Anomaly, SchedulerRun, SyncJob
+from .anomaly_detector import AnomalyDetector, AnomalyResult, RollingStats
+from .response_cache import ResponseCache
+from .asyncio_cron import CronScheduler, CronTrigger
 
 __all__ = [
     "DataStore",
@@ -12,6 +14,11 @@ __all__ = [
     "OracleUpdate",
     "Anomaly",
     "SchedulerRun",
+    "SyncJob",
     "AnomalyDetector",
     "AnomalyResult",
+    "RollingStats",
+    "ResponseCache",
+    "CronScheduler",
+    "CronTrigger",
 ]
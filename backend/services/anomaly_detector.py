@@ -4,6 +4,7 @@ Statistical anomaly detection for rate changes.
 
 Detects:
 - Value spikes: Rate value > N standard deviations from historical mean
+  (or, with the Hampel filter, > N scaled MADs from the historical median)
 - Stale data: Data age exceeds heartbeat threshold
 - Velocity: Rate of change exceeds threshold
 
@@ -11,15 +12,139 @@ Anomalies are logged but DO NOT block updates (monitoring only).
 """
 
 import logging
-import statistics
+import math
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Scales the median absolute deviation to estimate a normal std dev
+MAD_SCALE = 1.4826
 
-@dataclass
+# Relative spread below which a history counts as constant: float noise
+# from the variance arithmetic, not a real move in a published rate
+ZERO_VARIANCE_EPS = 1e-9
+
+# anomaly_mask() bits
+VALUE_ANOMALY = 1
+STALE_ANOMALY = 2
+VELOCITY_ANOMALY = 4
+
+
+def mean_stdev(values: Sequence[float]) -> Tuple[float, float]:
+    """
+    Mean and sample standard deviation of at least two values.
+
+    Matches statistics.mean/stdev to within float rounding but runs on
+    plain floats (math.fsum) instead of exact fractions, which is over an
+    order of magnitude faster for lookback-sized histories. The two-pass
+    fsum form is also more accurate than Welford's one-pass update on
+    near-constant series. Constant input returns exactly (value, 0.0).
+    """
+    first = values[0]
+    n = len(values)
+    # One C-level scan (vs. min + max) detects the constant case
+    if values.count(first) == n:
+        return float(first), 0.0
+
+    mean = math.fsum(values) / n
+    variance = math.fsum([(v - mean) * (v - mean) for v in values]) / (n - 1)
+    return mean, math.sqrt(variance)
+
+
+def constant_tolerance(mean: float) -> float:
+    """Largest std dev (and deviation from the mean) treated as zero."""
+    return ZERO_VARIANCE_EPS * max(abs(mean), 1.0)
+
+
+def median_mad(values: Sequence[float]) -> Tuple[float, float]:
+    """
+    Median and scaled median absolute deviation (MAD * 1.4826) of values.
+
+    Unlike mean/std dev, neither is pulled by the outliers being detected,
+    so a single bad print in the lookback window doesn't widen the band.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+    deviations = sorted(abs(v - median) for v in ordered)
+    mad = deviations[mid] if n % 2 else (deviations[mid - 1] + deviations[mid]) / 2
+    return median, MAD_SCALE * mad
+
+
+class RollingStats:
+    """
+    Running count, mean and sample standard deviation of a window.
+
+    Values can be added and removed in O(1), so a sliding lookback window
+    never needs a full rescan. Sums are kept relative to the first value
+    added (a shifted-data variance), which avoids the cancellation that
+    naive sum/sum-of-squares suffers on rates with small relative spread.
+
+    Usage:
+        stats = RollingStats([10.0, 10.2, 10.1])
+        stats.add(10.3)
+        stats.remove(10.0)
+        stats.mean, stats.std_dev
+    """
+
+    __slots__ = ("count", "_shift", "_sum", "_sum_sq")
+
+    def __init__(self, values: Iterable[float] = ()):
+        # Same sums as repeated add(), accumulated in locals
+        count = 0
+        shift = total = total_sq = 0.0
+        for value in values:
+            if count == 0:
+                shift = value
+            delta = value - shift
+            count += 1
+            total += delta
+            total_sq += delta * delta
+        self.count = count
+        self._shift = shift
+        self._sum = total
+        self._sum_sq = total_sq
+
+    def add(self, value: float) -> None:
+        """Add a value to the window."""
+        if self.count == 0:
+            self._shift = value
+            self._sum = 0.0
+            self._sum_sq = 0.0
+        delta = value - self._shift
+        self.count += 1
+        self._sum += delta
+        self._sum_sq += delta * delta
+
+    def remove(self, value: float) -> None:
+        """Remove a value previously added to the window."""
+        delta = value - self._shift
+        self.count -= 1
+        self._sum -= delta
+        self._sum_sq -= delta * delta
+
+    @property
+    def mean(self) -> float:
+        """Window mean (0.0 when empty)."""
+        if self.count == 0:
+            return 0.0
+        return self._shift + self._sum / self.count
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation (0.0 for fewer than two values)."""
+        if self.count < 2:
+            return 0.0
+        variance = (self._sum_sq - self._sum * self._sum / self.count) / (self.count - 1)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+
+@dataclass(slots=True, frozen=True)
 class AnomalyResult:
     """Result of an anomaly detection check."""
     is_anomaly: bool
@@ -60,6 +185,9 @@ class AnomalyDetector:
 
         if result.is_anomaly:
             print(f"Anomaly: {result.message}")
+
+        # Or keep the window inside the detector (O(1) per sample)
+        result = detector.detect_value_anomaly_online("CDI", 10.9)
     """
 
     def __init__(
@@ -82,6 +210,8 @@ class AnomalyDetector:
         self.lookback_days = lookback_days
         self.velocity_threshold = velocity_threshold
         self.min_history_size = min_history_size
+        # rate_type -> (last lookback_days samples, their running statistics)
+        self._windows: Dict[str, Tuple[Deque[float], RollingStats]] = {}
 
     def detect_value_anomaly(
         self,
@@ -101,8 +231,104 @@ class AnomalyDetector:
         Returns:
             AnomalyResult with detection details
         """
-        # Need sufficient history for meaningful statistics
         if len(historical_values) < self.min_history_size:
+            return self.detect_with_stats(current_value, current_value, 0, len(historical_values))
+
+        mean, std_dev = mean_stdev(historical_values)
+        return self.detect_with_stats(current_value, mean, std_dev, len(historical_values))
+
+    def update(self, rate_type: str, value: float) -> None:
+        """
+        Add a sample to a rate's window, evicting the oldest beyond lookback_days.
+
+        Args:
+            rate_type: Rate identifier (e.g., "CDI")
+            value: New rate value
+        """
+        entry = self._windows.get(rate_type)
+        if entry is None:
+            entry = self._windows[rate_type] = (deque(), RollingStats())
+        window, stats = entry
+
+        window.append(value)
+        stats.add(value)
+        if len(window) > self.lookback_days:
+            stats.remove(window.popleft())
+
+    def detect_value_anomaly_online(
+        self,
+        rate_type: str,
+        current_value: float
+    ) -> AnomalyResult:
+        """
+        Check a value against the detector's own window for rate_type, then add it.
+
+        Same check as detect_value_anomaly without passing (or re-reducing)
+        the history: the window's statistics are maintained by update().
+
+        Args:
+            rate_type: Rate identifier (e.g., "CDI")
+            current_value: The new rate value to check
+
+        Returns:
+            AnomalyResult with detection details
+        """
+        entry = self._windows.get(rate_type)
+        if entry is None:
+            result = self.detect_with_stats(current_value, current_value, 0, 0)
+        else:
+            stats = entry[1]
+            result = self.detect_with_stats(current_value, stats.mean, stats.std_dev, stats.count)
+        self.update(rate_type, current_value)
+        return result
+
+    def is_value_anomaly(
+        self,
+        current_value: float,
+        mean: float,
+        std_dev: float,
+        count: int
+    ) -> bool:
+        """
+        detect_with_stats(...).is_anomaly without building the result.
+
+        Lets hot paths skip the AnomalyResult (and its message) for the
+        common, normal case and only call detect_with_stats on a hit.
+        """
+        if count < self.min_history_size:
+            return False
+        tolerance = constant_tolerance(mean)
+        if std_dev < tolerance:
+            return abs(current_value - mean) > tolerance
+        return abs(current_value - mean) / std_dev > self.std_threshold
+
+    def detect_with_stats(
+        self,
+        current_value: float,
+        mean: float,
+        std_dev: float,
+        count: int
+    ) -> AnomalyResult:
+        """
+        Detect a value anomaly from precomputed window statistics.
+
+        Same check as detect_value_anomaly, for callers that maintain the
+        history's statistics incrementally (see RollingStats).
+
+        Args:
+            current_value: The new rate value to check
+            mean: Historical mean
+            std_dev: Historical sample standard deviation
+            count: Number of historical values behind mean/std_dev
+
+        Returns:
+            AnomalyResult with detection details
+        """
+        std_threshold = self.std_threshold
+        min_history_size = self.min_history_size
+
+        # Need sufficient history for meaningful statistics
+        if count < min_history_size:
             return AnomalyResult(
                 is_anomaly=False,
                 anomaly_type=None,
@@ -110,34 +336,30 @@ class AnomalyDetector:
                 mean=current_value,
                 std_dev=0,
                 z_score=0,
-                message=f"Insufficient history ({len(historical_values)} < {self.min_history_size})"
+                message=f"Insufficient history ({count} < {min_history_size})"
             )
 
-        # Calculate statistics
-        mean = statistics.mean(historical_values)
-        std_dev = statistics.stdev(historical_values)
-
-        # Handle zero std dev (all values identical)
-        if std_dev == 0:
+        # Handle zero std dev (all values identical, up to float noise)
+        tolerance = constant_tolerance(mean)
+        if std_dev < tolerance:
             # Any different value is technically an anomaly
-            is_anomaly = current_value != mean
-            z_score = float('inf') if is_anomaly else 0
+            # (reported as z_score 999 rather than infinity)
+            is_anomaly = abs(current_value - mean) > tolerance
             return AnomalyResult(
                 is_anomaly=is_anomaly,
                 anomaly_type="value_spike" if is_anomaly else None,
                 current_value=current_value,
                 mean=mean,
                 std_dev=0,
-                z_score=z_score if z_score != float('inf') else 999,
+                z_score=999 if is_anomaly else 0,
                 message=f"Value {current_value} differs from constant {mean}"
             )
 
-        # Calculate z-score
-        z_score = abs(current_value - mean) / std_dev
-        is_anomaly = z_score > self.std_threshold
-
-        # Determine direction of anomaly
-        direction = "above" if current_value > mean else "below"
+        # Calculate z-score (the sign of the deviation gives the direction)
+        deviation = current_value - mean
+        z_score = abs(deviation) / std_dev
+        is_anomaly = z_score > std_threshold
+        direction = "above" if deviation > 0 else "below"
 
         return AnomalyResult(
             is_anomaly=is_anomaly,
@@ -148,14 +370,59 @@ class AnomalyDetector:
             z_score=z_score,
             message=(
                 f"Value {current_value:.4f} is {z_score:.2f} std devs {direction} "
-                f"mean {mean:.4f} (threshold: {self.std_threshold})"
+                f"mean {mean:.4f} (threshold: {std_threshold})"
+            )
+        )
+
+    def detect_hampel_anomaly(
+        self,
+        current_value: float,
+        historical_values: Sequence[float]
+    ) -> AnomalyResult:
+        """
+        Detect a value anomaly with a Hampel filter (median / MAD).
+
+        Flags values more than N scaled MADs from the historical median.
+        Stepwise rates (SELIC, TR) often have a window where most values are
+        identical, giving a zero MAD; those fall back to the z-score check.
+
+        Args:
+            current_value: The new rate value to check
+            historical_values: List of recent historical values
+
+        Returns:
+            AnomalyResult with detection details (mean/std_dev hold the
+            median and scaled MAD)
+        """
+        if len(historical_values) < self.min_history_size:
+            return self.detect_with_stats(current_value, current_value, 0, len(historical_values))
+
+        median, mad = median_mad(historical_values)
+        if mad == 0:
+            return self.detect_value_anomaly(current_value, list(historical_values))
+
+        score = abs(current_value - median) / mad
+        is_anomaly = score > self.std_threshold
+        direction = "above" if current_value > median else "below"
+
+        return AnomalyResult(
+            is_anomaly=is_anomaly,
+            anomaly_type="value_spike" if is_anomaly else None,
+            current_value=current_value,
+            mean=median,
+            std_dev=mad,
+            z_score=score,
+            message=(
+                f"Value {current_value:.4f} is {score:.2f} MADs {direction} "
+                f"median {median:.4f} (threshold: {self.std_threshold})"
             )
         )
 
     def detect_stale_data(
         self,
         last_update: datetime,
-        heartbeat_seconds: int
+        heartbeat_seconds: int,
+        now: Optional[datetime] = None
     ) -> AnomalyResult:
         """
         Detect if data is stale (exceeds heartbeat threshold).
@@ -163,11 +430,14 @@ class AnomalyDetector:
         Args:
             last_update: Timestamp of last update
             heartbeat_seconds: Maximum expected time between updates
+            now: Reference time (default: current time); pass one value
+                when checking several rates so they share a clock reading
 
         Returns:
             AnomalyResult indicating staleness
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         age_seconds = (now - last_update).total_seconds()
         is_stale = age_seconds > heartbeat_seconds
 
@@ -238,8 +508,9 @@ class AnomalyDetector:
         # Normalize to daily rate
         daily_change = change_rate * (24 / time_delta_hours) if time_delta_hours > 0 else change_rate
 
-        is_anomaly = daily_change > self.velocity_threshold
-        velocity_ratio = daily_change / self.velocity_threshold if self.velocity_threshold > 0 else 0
+        velocity_threshold = self.velocity_threshold
+        is_anomaly = daily_change > velocity_threshold
+        velocity_ratio = daily_change / velocity_threshold if velocity_threshold > 0 else 0
 
         direction = "increase" if current_value > previous_value else "decrease"
 
@@ -253,10 +524,76 @@ class AnomalyDetector:
             message=(
                 f"Daily {direction} rate {daily_change*100:.1f}% "
                 f"{'exceeds' if is_anomaly else 'within'} "
-                f"threshold {self.velocity_threshold*100:.1f}%"
+                f"threshold {velocity_threshold*100:.1f}%"
             )
         )
 
+    def anomaly_mask(
+        self,
+        current_value: float,
+        historical_values: List[float],
+        last_update: Optional[datetime] = None,
+        heartbeat_seconds: Optional[int] = None,
+        previous_value: Optional[float] = None,
+        time_delta_hours: float = 24,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        Which checks flag an anomaly, as VALUE/STALE/VELOCITY_ANOMALY bits.
+
+        Same decisions as run_all_checks without building AnomalyResults or
+        messages; 0 means nothing to report (the usual case).
+
+        Args:
+            Same as run_all_checks
+
+        Returns:
+            Bitwise OR of the *_ANOMALY flags that fired
+        """
+        return self._mask(
+            current_value, self._value_stats(historical_values), last_update,
+            heartbeat_seconds, previous_value, time_delta_hours, now
+        )
+
+    def _value_stats(self, historical_values: List[float]) -> Tuple[float, float, int]:
+        """(mean, std_dev, count) for the value check; count < min_history_size skips it."""
+        count = len(historical_values)
+        if count < self.min_history_size:
+            return 0.0, 0.0, count
+        mean, std_dev = mean_stdev(historical_values)
+        return mean, std_dev, count
+
+    def _mask(
+        self,
+        current_value: float,
+        value_stats: Tuple[float, float, int],
+        last_update: Optional[datetime],
+        heartbeat_seconds: Optional[int],
+        previous_value: Optional[float],
+        time_delta_hours: float,
+        now: Optional[datetime]
+    ) -> int:
+        """anomaly_mask() with the value statistics already computed."""
+        mask = 0
+
+        mask |= VALUE_ANOMALY * self.is_value_anomaly(current_value, *value_stats)
+
+        if last_update is not None and heartbeat_seconds is not None:
+            if now is None:
+                now = datetime.now()
+            age_seconds = (now - last_update).total_seconds()
+            mask |= STALE_ANOMALY * (age_seconds > heartbeat_seconds)
+
+        if previous_value is not None:
+            if previous_value == 0:
+                mask |= VELOCITY_ANOMALY * (current_value != 0)
+            else:
+                change_rate = abs(current_value - previous_value) / abs(previous_value)
+                daily_change = change_rate * (24 / time_delta_hours) if time_delta_hours > 0 else change_rate
+                mask |= VELOCITY_ANOMALY * (daily_change > self.velocity_threshold)
+
+        return mask
+
     def run_all_checks(
         self,
         current_value: float,
@@ -264,7 +601,8 @@ class AnomalyDetector:
         last_update: Optional[datetime] = None,
         heartbeat_seconds: Optional[int] = None,
         previous_value: Optional[float] = None,
-        time_delta_hours: float = 24
+        time_delta_hours: float = 24,
+        now: Optional[datetime] = None
     ) -> List[AnomalyResult]:
         """
         Run all applicable anomaly checks.
@@ -276,42 +614,50 @@ class AnomalyDetector:
             heartbeat_seconds: Heartbeat threshold (for stale check)
             previous_value: Previous value (for velocity check)
             time_delta_hours: Time delta for velocity check
+            now: Reference time for the stale check (default: current time)
 
         Returns:
             List of AnomalyResult for each check that found an anomaly
         """
+        # One clock reading shared by the mask and the stale result
+        if now is None and last_update is not None:
+            now = datetime.now()
+        value_stats = self._value_stats(historical_values)
+        mask = self._mask(
+            current_value, value_stats, last_update,
+            heartbeat_seconds, previous_value, time_delta_hours, now
+        )
+        if not mask:
+            return []
+
+        # Only flagged checks build a full result (reusing the statistics)
         anomalies = []
 
-        # Value anomaly check
-        value_result = self.detect_value_anomaly(current_value, historical_values)
-        if value_result.is_anomaly:
+        if mask & VALUE_ANOMALY:
+            value_result = self.detect_with_stats(current_value, *value_stats)
             anomalies.append(value_result)
             logger.warning(
-                f"Value anomaly detected: {value_result.message}",
+                "Value anomaly detected: %s", value_result.message,
                 extra={"anomaly_type": "value_spike", "z_score": value_result.z_score}
             )
 
-        # Stale data check
-        if last_update is not None and heartbeat_seconds is not None:
-            stale_result = self.detect_stale_data(last_update, heartbeat_seconds)
-            if stale_result.is_anomaly:
-                anomalies.append(stale_result)
-                logger.warning(
-                    f"Stale data detected: {stale_result.message}",
-                    extra={"anomaly_type": "stale_data", "z_score": stale_result.z_score}
-                )
+        if mask & STALE_ANOMALY:
+            stale_result = self.detect_stale_data(last_update, heartbeat_seconds, now)
+            anomalies.append(stale_result)
+            logger.warning(
+                "Stale data detected: %s", stale_result.message,
+                extra={"anomaly_type": "stale_data", "z_score": stale_result.z_score}
+            )
 
-        # Velocity check
-        if previous_value is not None:
+        if mask & VELOCITY_ANOMALY:
             velocity_result = self.detect_velocity_anomaly(
                 current_value, previous_value, time_delta_hours
             )
-            if velocity_result.is_anomaly:
-                anomalies.append(velocity_result)
-                logger.warning(
-                    f"Velocity anomaly detected: {velocity_result.message}",
-                    extra={"anomaly_type": "velocity", "z_score": velocity_result.z_score}
-                )
+            anomalies.append(velocity_result)
+            logger.warning(
+                "Velocity anomaly detected: %s", velocity_result.message,
+                extra={"anomaly_type": "velocity", "z_score": velocity_result.z_score}
+            )
 
         return anomalies
 
@@ -333,10 +679,7 @@ class AnomalyDetector:
                 return (min(historical_values), max(historical_values))
             return (0, 0)
 
-        mean = statistics.mean(historical_values)
-        std_dev = statistics.stdev(historical_values)
-
-        lower = mean - (self.std_threshold * std_dev)
-        upper = mean + (self.std_threshold * std_dev)
+        mean, std_dev = mean_stdev(historical_values)
 
-        return (lower, upper)
+        band = self.std_threshold * std_dev
+        return (mean - band, mean + band)
@@ -0,0 +1,241 @@
+"""
+DELOS Asyncio Cron
+Cron-style job runner built directly on asyncio tasks.
+
+Each job is one task that sleeps until its next fire time, so an idle
+scheduler costs nothing between runs (no polling loop or job store).
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, tzinfo
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# How far ahead to look for a matching day before giving up (covers
+# day-of-month values that only exist in some months)
+MAX_LOOKAHEAD_DAYS = 366 * 4
+
+CronField = Union[int, str, None]
+
+
+def _parse_field(value: CronField, low: int, high: int, names: Optional[List[str]] = None) -> FrozenSet[int]:
+    """
+    Parse a cron field into the set of allowed values.
+
+    Supports "*", single values, "a-b" ranges, "*/n" and "a-b/n" steps and
+    comma-separated lists; names (e.g. "mon") are accepted where given.
+    """
+    if value is None:
+        return frozenset(range(low, high + 1))
+    if isinstance(value, int):
+        return frozenset([value])
+
+    def to_int(token: str) -> int:
+        if names and token.lower() in names:
+            return names.index(token.lower()) + low
+        return int(token)
+
+    allowed = set()
+    for part in value.split(","):
+        part, _, step = part.partition("/")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (to_int(p) for p in part.split("-", 1))
+        else:
+            start = end = to_int(part)
+        allowed.update(range(start, end + 1, int(step) if step else 1))
+
+    if not allowed or min(allowed) < low or max(allowed) > high:
+        raise ValueError(f"Invalid cron field {value!r} (allowed {low}-{high})")
+    return frozenset(allowed)
+
+
+class CronTrigger:
+    """
+    Cron schedule with minute resolution.
+
+    Fields left as None match every value, except minute, which defaults
+    to 0 so hourly/daily schedules fire on the hour.
+
+    Usage:
+        trigger = CronTrigger(hour=19, minute=0, day_of_week="mon-fri", timezone=BRT)
+        next_fire = trigger.get_next_fire_time(datetime.now(BRT))
+    """
+
+    def __init__(
+        self,
+        minute: CronField = 0,
+        hour: CronField = None,
+        day: CronField = None,
+        day_of_week: CronField = None,
+        timezone: Optional[tzinfo] = None,
+    ):
+        self.fields = {"day": day, "day_of_week": day_of_week, "hour": hour, "minute": minute}
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days = _parse_field(day, 1, 31)
+        self.weekdays = _parse_field(day_of_week, 0, 6, WEEKDAYS)
+        self.timezone = timezone
+        # (hour, minute) pairs in firing order within a matching day
+        self._times = sorted((h, m) for h in self.hours for m in self.minutes)
+
+    def get_next_fire_time(self, now: datetime) -> datetime:
+        """
+        First fire time strictly after now.
+
+        Args:
+            now: Reference time (converted to the trigger's timezone)
+
+        Returns:
+            Timezone-aware datetime of the next fire
+        """
+        if self.timezone is not None:
+            now = now.astimezone(self.timezone)
+        now = now.replace(second=0, microsecond=0)
+
+        day = now.replace(hour=0, minute=0)
+        for _ in range(MAX_LOOKAHEAD_DAYS):
+            if day.day in self.days and day.weekday() in self.weekdays:
+                for hour, minute in self._times:
+                    candidate = day.replace(hour=hour, minute=minute)
+                    if candidate > now:
+                        return candidate
+            day += timedelta(days=1)
+
+        raise ValueError(f"{self} never fires")
+
+    def __str__(self) -> str:
+        fields = ", ".join(f"{name}='{value}'" for name, value in self.fields.items() if value is not None)
+        return f"cron[{fields}]"
+
+
+@dataclass
+class CronJob:
+    """A scheduled coroutine function and its runtime state."""
+    id: str
+    name: str
+    func: Callable[[], Awaitable]
+    trigger: CronTrigger
+    misfire_grace_time: Optional[float] = None  # Seconds late a fire may still run
+    next_run_time: Optional[datetime] = None
+    running: Optional[asyncio.Task] = field(default=None, repr=False)
+
+
+class CronScheduler:
+    """
+    Runs CronJobs as asyncio tasks.
+
+    Runs never overlap: a fire that arrives while the previous run is still
+    going is skipped. Fires that were delayed past misfire_grace_time (e.g.
+    the event loop was blocked) are reported as missed, and only one run is
+    made however many fires were missed.
+
+    Usage:
+        scheduler = CronScheduler(on_executed=..., on_error=..., on_missed=...)
+        scheduler.add_job(update, CronTrigger(hour=19), id="daily", name="Daily")
+        scheduler.start()
+        ...
+        await scheduler.shutdown()
+    """
+
+    def __init__(
+        self,
+        on_executed: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[str, BaseException], None]] = None,
+        on_missed: Optional[Callable[[str], None]] = None,
+    ):
+        self._jobs: Dict[str, CronJob] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._on_executed = on_executed
+        self._on_error = on_error
+        self._on_missed = on_missed
+
+    def add_job(
+        self,
+        func: Callable[[], Awaitable],
+        trigger: CronTrigger,
+        id: str,
+        name: str,
+        misfire_grace_time: Optional[float] = None,
+    ) -> CronJob:
+        """
+        Register a job (replacing any job with the same id).
+
+        Jobs added after start() begin running on the next start().
+        """
+        job = CronJob(id=id, name=name, func=func, trigger=trigger, misfire_grace_time=misfire_grace_time)
+        self._jobs[id] = job
+        return job
+
+    def get_jobs(self) -> List[CronJob]:
+        """Registered jobs, with next_run_time set once started."""
+        return list(self._jobs.values())
+
+    def start(self) -> None:
+        """Start one timer task per job."""
+        for job in self._jobs.values():
+            job.next_run_time = job.trigger.get_next_fire_time(datetime.now(job.trigger.timezone))
+            self._tasks.append(asyncio.create_task(self._run_job_loop(job), name=f"cron:{job.id}"))
+
+    async def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop all timers.
+
+        Args:
+            wait: If True, let in-progress job runs finish; otherwise cancel them
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        running = [job.running for job in self._jobs.values() if job.running is not None]
+        if not wait:
+            for task in running:
+                task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+    async def _run_job_loop(self, job: CronJob) -> None:
+        """Sleep until each fire time and launch the job."""
+        tz = job.trigger.timezone
+        while True:
+            fire_time = job.next_run_time
+            now = datetime.now(tz)
+            # Wall-clock time can drift from the loop's monotonic clock over
+            # long sleeps; re-check rather than firing early
+            while now < fire_time:
+                await asyncio.sleep((fire_time - now).total_seconds())
+                now = datetime.now(tz)
+
+            # Coalesce: whatever was missed, the next fire is after now
+            job.next_run_time = job.trigger.get_next_fire_time(now)
+
+            lateness = (now - fire_time).total_seconds()
+            if job.misfire_grace_time is not None and lateness > job.misfire_grace_time:
+                if self._on_missed:
+                    self._on_missed(job.id)
+            elif job.running is not None and not job.running.done():
+                logger.warning("Job %s still running; skipping run at %s", job.id, fire_time.isoformat())
+            else:
+                job.running = asyncio.create_task(self._execute(job))
+
+    async def _execute(self, job: CronJob) -> None:
+        """Run a job once and report the outcome."""
+        try:
+            await job.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self._on_error:
+                self._on_error(job.id, e)
+            else:
+                logger.exception("Job %s failed", job.id)
+        else:
+            if self._on_executed:
+                self._on_executed(job.id)
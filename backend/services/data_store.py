@@ -3,34 +3,43 @@ DELOS Data Store
 SQLite-based persistence for rate history, anomaly logs, and update tracking.
 """
 
+import asyncio
 import aiosqlite
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Scale of the stored answer column (bcb_client.CHAINLINK_PRECISION)
+ANSWER_PRECISION = 10 ** 8
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StoredRate:
     """Rate data stored in the database."""
     id: int
     rate_type: str
     answer: int  # Chainlink scaled (10^8)
-    raw_value: float
     real_world_date: int  # YYYYMMDD
     bcb_timestamp: datetime
     fetch_timestamp: datetime
     source: str
 
+    @property
+    def raw_value(self) -> float:
+        """Original BCB value (answer unscaled)."""
+        return self.answer / ANSWER_PRECISION
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleUpdate:
     """Oracle update transaction record."""
     id: int
@@ -43,7 +52,7 @@ class OracleUpdate:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Anomaly:
     """Detected anomaly record."""
     id: int
@@ -57,7 +66,7 @@ class Anomaly:
     message: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SchedulerRun:
     """Scheduler job execution record."""
     id: int
@@ -70,6 +79,22 @@ class SchedulerRun:
     error_message: Optional[str]
 
 
+@dataclass(slots=True, frozen=True)
+class SyncJob:
+    """Manual sync job record (runs in the background after /sync returns)."""
+    id: int
+    rate_types: List[str]
+    status: str  # 'pending', 'completed', 'failed'
+    created_at: datetime
+    completed_at: Optional[datetime]
+    rates_updated: int
+    rates_skipped: int
+    rates_failed: int
+    anomalies_detected: int
+    tx_hash: Optional[str]
+    error_message: Optional[str]
+
+
 # =============================================================================
 # SCHEMA
 # =============================================================================
@@ -79,8 +104,7 @@ SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS rates (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     rate_type TEXT NOT NULL,
-    answer INTEGER NOT NULL,
-    raw_value REAL NOT NULL,
+    answer INTEGER NOT NULL,  -- raw_value * 10^8 (raw_value is derived on read)
     real_world_date INTEGER NOT NULL,
     bcb_timestamp DATETIME NOT NULL,
     fetch_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -88,8 +112,11 @@ CREATE TABLE IF NOT EXISTS rates (
     UNIQUE(rate_type, real_world_date)
 );
 
--- Index for history queries
-CREATE INDEX IF NOT EXISTS idx_rates_type_date ON rates(rate_type, real_world_date DESC);
+-- Covering index for anomaly history queries (answered from the index alone);
+-- supersedes idx_rates_type_date, whose order UNIQUE(rate_type, real_world_date) also gives
+DROP INDEX IF EXISTS idx_rates_type_date;
+CREATE INDEX IF NOT EXISTS idx_rates_history
+    ON rates(rate_type, real_world_date DESC, fetch_timestamp, answer);
 
 -- Oracle blockchain transactions
 CREATE TABLE IF NOT EXISTS oracle_updates (
@@ -104,6 +131,7 @@ CREATE TABLE IF NOT EXISTS oracle_updates (
 );
 
 CREATE INDEX IF NOT EXISTS idx_oracle_updates_timestamp ON oracle_updates(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_oracle_updates_rate_time ON oracle_updates(rate_type, timestamp DESC);
 
 -- Detected anomalies
 CREATE TABLE IF NOT EXISTS anomalies (
@@ -119,6 +147,7 @@ CREATE TABLE IF NOT EXISTS anomalies (
 );
 
 CREATE INDEX IF NOT EXISTS idx_anomalies_type_date ON anomalies(rate_type, detected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_anomalies_detected_at ON anomalies(detected_at DESC);
 
 -- Scheduler job runs
 CREATE TABLE IF NOT EXISTS scheduler_runs (
@@ -133,8 +162,76 @@ CREATE TABLE IF NOT EXISTS scheduler_runs (
 );
 
 CREATE INDEX IF NOT EXISTS idx_scheduler_runs_started ON scheduler_runs(started_at DESC);
+
+-- Manual sync jobs triggered via the API
+CREATE TABLE IF NOT EXISTS sync_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rate_types TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at DATETIME NOT NULL,
+    completed_at DATETIME,
+    rates_updated INTEGER DEFAULT 0,
+    rates_skipped INTEGER DEFAULT 0,
+    rates_failed INTEGER DEFAULT 0,
+    anomalies_detected INTEGER DEFAULT 0,
+    tx_hash TEXT,
+    error_message TEXT
+);
+"""
+
+# Databases created before raw_value was dropped from rates: rebuild the table
+# without it (portable to SQLite versions without ALTER TABLE DROP COLUMN).
+# Its indexes go with the old table; SCHEMA_SQL recreates them afterwards.
+RATES_DROP_RAW_VALUE_SQL = """
+BEGIN;
+CREATE TABLE rates_migrated (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rate_type TEXT NOT NULL,
+    answer INTEGER NOT NULL,
+    real_world_date INTEGER NOT NULL,
+    bcb_timestamp DATETIME NOT NULL,
+    fetch_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    source TEXT NOT NULL,
+    UNIQUE(rate_type, real_world_date)
+);
+INSERT INTO rates_migrated
+    (id, rate_type, answer, real_world_date, bcb_timestamp, fetch_timestamp, source)
+SELECT id, rate_type, answer, real_world_date, bcb_timestamp, fetch_timestamp, source
+FROM rates;
+-- Carry over the AUTOINCREMENT high-water mark so ids freed by earlier
+-- deletes are not reused (DROP TABLE would discard it)
+DELETE FROM sqlite_sequence WHERE name = 'rates_migrated';
+UPDATE sqlite_sequence SET name = 'rates_migrated' WHERE name = 'rates';
+DROP TABLE rates;
+ALTER TABLE rates_migrated RENAME TO rates;
+COMMIT;
 """
 
+STATS_SQL = """
+SELECT
+    (SELECT COUNT(*) FROM rates),
+    (SELECT COUNT(*) FROM oracle_updates),
+    (SELECT COUNT(*) FROM anomalies),
+    (SELECT COUNT(*) FROM scheduler_runs)
+"""
+
+# WAL lets API reads proceed while the scheduler writes. Unlike the pragmas
+# below, journal_mode is persisted in the database file, so it is set once.
+JOURNAL_MODE_PRAGMA = "PRAGMA journal_mode=WAL"
+
+# Applied to every pooled connection (these settings are per-connection in SQLite).
+# synchronous=NORMAL is durable against app crashes in WAL mode; rate data can
+# be re-fetched from BCB after a power loss.
+CONNECTION_PRAGMAS = [
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-20000",    # ~20 MB
+]
+
+# Maximum number of pooled connections
+POOL_SIZE = 8
+
 
 # =============================================================================
 # DATA STORE
@@ -161,19 +258,86 @@ class DataStore:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._initialized = False
+        # Created lazily so the queue binds to the running event loop
+        self._pool: Optional[asyncio.Queue] = None
+        self._pool_connections: List[aiosqlite.Connection] = []
+        self._pool_opened = 0
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open a connection with CONNECTION_PRAGMAS applied."""
+        db = await aiosqlite.connect(self.db_path)
+        for pragma in CONNECTION_PRAGMAS:
+            await db.execute(pragma)
+        return db
+
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a pooled connection.
+
+        Connections are opened on demand up to POOL_SIZE and returned to the
+        pool afterwards. Uncommitted work is rolled back if the caller fails,
+        and row_factory is reset so each borrower starts with plain tuples.
+        """
+        if self._pool is None:
+            self._pool = asyncio.Queue(maxsize=POOL_SIZE)
+
+        if self._pool.empty() and self._pool_opened < POOL_SIZE:
+            # Reserve the slot before awaiting so concurrent borrowers can't overshoot
+            self._pool_opened += 1
+            try:
+                db = await self._open_connection()
+            except BaseException:
+                self._pool_opened -= 1
+                raise
+            self._pool_connections.append(db)
+        else:
+            db = await self._pool.get()
+
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        finally:
+            db.row_factory = None
+            self._pool.put_nowait(db)
 
     async def initialize(self) -> None:
         """Create database tables if they don't exist."""
         if self._initialized:
             return
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
+            async with db.execute(JOURNAL_MODE_PRAGMA) as cursor:
+                (journal_mode,) = await cursor.fetchone()
+            if journal_mode.lower() != "wal":
+                # e.g. network filesystems without shared-memory support
+                logger.warning(f"SQLite WAL unavailable, using journal_mode={journal_mode}")
+            async with db.execute("SELECT name FROM pragma_table_info('rates')") as cursor:
+                rate_columns = {name for (name,) in await cursor.fetchall()}
+            if "raw_value" in rate_columns:
+                logger.info("Migrating rates table: dropping raw_value column")
+                await db.executescript(RATES_DROP_RAW_VALUE_SQL)
             await db.executescript(SCHEMA_SQL)
             await db.commit()
 
         self._initialized = True
         logger.info(f"DataStore initialized: {self.db_path}")
 
+    async def close(self) -> None:
+        """
+        Close all pooled connections.
+
+        Must be called on shutdown: each aiosqlite connection runs on its own
+        non-daemon thread, which would otherwise keep the process alive.
+        """
+        for db in self._pool_connections:
+            await db.close()
+        self._pool_connections.clear()
+        self._pool_opened = 0
+        self._pool = None
+
     # =========================================================================
     # RATE DATA
     # =========================================================================
@@ -190,17 +354,16 @@ class DataStore:
         Returns:
             Row ID of inserted/updated record
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 """
                 INSERT OR REPLACE INTO rates
-                (rate_type, answer, raw_value, real_world_date, bcb_timestamp, source)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (rate_type, answer, real_world_date, bcb_timestamp, source)
+                VALUES (?, ?, ?, ?, ?)
                 """,
                 (
                     rate_data.rate_type.value if hasattr(rate_data.rate_type, 'value') else rate_data.rate_type,
                     rate_data.answer,
-                    rate_data.raw_value,
                     rate_data.real_world_date,
                     rate_data.timestamp.isoformat(),
                     rate_data.source,
@@ -209,6 +372,69 @@ class DataStore:
             await db.commit()
             return cursor.lastrowid
 
+    async def store_rates_batch(self, rates: List[Any]) -> None:
+        """
+        Store several BCB rates in one transaction.
+
+        Same INSERT OR REPLACE semantics as store_rate, with a single commit.
+
+        Args:
+            rates: RateData objects from BCB client
+        """
+        if not rates:
+            return
+
+        async with self._acquire() as db:
+            await self._insert_rates(db, rates)
+            await db.commit()
+
+    async def store_rates_with_anomalies(
+        self,
+        rates: List[Any],
+        anomalies: List[Tuple[str, str, float, float, float, float, str]]
+    ) -> None:
+        """
+        Store a run's rates and their anomalies in one transaction.
+
+        Same rows as store_rates_batch + log_anomalies_batch, with a single
+        commit (one WAL sync) instead of one per table.
+
+        Args:
+            rates: RateData objects from BCB client
+            anomalies: Anomaly tuples, as in log_anomalies_batch
+        """
+        if not rates and not anomalies:
+            return
+
+        async with self._acquire() as db:
+            if rates:
+                await self._insert_rates(db, rates)
+            if anomalies:
+                await self._insert_anomalies(db, anomalies)
+            await db.commit()
+        self._log_anomalies(anomalies)
+
+    @staticmethod
+    async def _insert_rates(db: aiosqlite.Connection, rates: List[Any]) -> None:
+        """INSERT OR REPLACE rates rows (caller commits)."""
+        await db.executemany(
+            """
+            INSERT OR REPLACE INTO rates
+            (rate_type, answer, real_world_date, bcb_timestamp, source)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    rate_data.rate_type.value if hasattr(rate_data.rate_type, 'value') else rate_data.rate_type,
+                    rate_data.answer,
+                    rate_data.real_world_date,
+                    rate_data.timestamp.isoformat(),
+                    rate_data.source,
+                )
+                for rate_data in rates
+            ]
+        )
+
     async def get_rate_history(
         self,
         rate_type: str,
@@ -226,7 +452,7 @@ class DataStore:
         """
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """
@@ -243,7 +469,6 @@ class DataStore:
                     id=row["id"],
                     rate_type=row["rate_type"],
                     answer=row["answer"],
-                    raw_value=row["raw_value"],
                     real_world_date=row["real_world_date"],
                     bcb_timestamp=datetime.fromisoformat(row["bcb_timestamp"]),
                     fetch_timestamp=datetime.fromisoformat(row["fetch_timestamp"]) if row["fetch_timestamp"] else datetime.now(),
@@ -252,6 +477,103 @@ class DataStore:
                 for row in rows
             ]
 
+    async def get_rate_history_rows(
+        self,
+        rate_type: str,
+        days: int = 30
+    ) -> List[Tuple[int, float, int, str, str]]:
+        """
+        Get historical rates as raw rows, without building StoredRate objects.
+
+        Args:
+            rate_type: Rate type (e.g., "CDI", "IPCA")
+            days: Number of days of history to fetch
+
+        Returns:
+            List of (answer, raw_value, real_world_date, bcb_timestamp, source)
+            tuples, most recent first. bcb_timestamp is an ISO 8601 string.
+        """
+        cutoff_date = datetime.now() - timedelta(days=days)
+
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                """
+                SELECT answer, answer / 1e8, real_world_date, bcb_timestamp, source
+                FROM rates
+                WHERE rate_type = ? AND fetch_timestamp >= ?
+                ORDER BY real_world_date DESC
+                """,
+                (rate_type, cutoff_date.isoformat())
+            )
+            return await cursor.fetchall()
+
+    async def get_rate_histories(
+        self,
+        rate_types: List[str],
+        days: int = 30
+    ) -> Dict[str, List[Tuple[int, float]]]:
+        """
+        Get (real_world_date, raw_value) history for several rates in one query.
+
+        Args:
+            rate_types: Rate types (e.g., ["CDI", "SELIC"])
+            days: Number of days of history to fetch
+
+        Returns:
+            Dict of rate type to (real_world_date, raw_value) tuples, most
+            recent first. Every requested rate type is present.
+        """
+        histories: Dict[str, List[Tuple[int, float]]] = {rt: [] for rt in rate_types}
+        if not rate_types:
+            return histories
+
+        cutoff_date = datetime.now() - timedelta(days=days)
+        placeholders = ",".join("?" * len(rate_types))
+
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                f"""
+                SELECT rate_type, real_world_date, answer / 1e8
+                FROM rates
+                WHERE rate_type IN ({placeholders}) AND fetch_timestamp >= ?
+                ORDER BY rate_type, real_world_date DESC
+                """,
+                (*rate_types, cutoff_date.isoformat())
+            )
+            for rate_type, real_world_date, raw_value in await cursor.fetchall():
+                histories[rate_type].append((real_world_date, raw_value))
+
+        return histories
+
+    async def get_rate_history_range(
+        self,
+        rate_type: str,
+        start: datetime,
+        end: datetime
+    ) -> List[Tuple[int, float, int, str, str]]:
+        """
+        Get raw history rows fetched within [start, end).
+
+        Args:
+            rate_type: Rate type (e.g., "CDI", "IPCA")
+            start: Inclusive lower bound on fetch time
+            end: Exclusive upper bound on fetch time
+
+        Returns:
+            Row tuples as in get_rate_history_rows, most recent first
+        """
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                """
+                SELECT answer, answer / 1e8, real_world_date, bcb_timestamp, source
+                FROM rates
+                WHERE rate_type = ? AND fetch_timestamp >= ? AND fetch_timestamp < ?
+                ORDER BY real_world_date DESC
+                """,
+                (rate_type, start.isoformat(), end.isoformat())
+            )
+            return await cursor.fetchall()
+
     async def get_latest_rate(self, rate_type: str) -> Optional[StoredRate]:
         """Get the most recent stored rate for a type."""
         history = await self.get_rate_history(rate_type, days=365)
@@ -284,7 +606,7 @@ class DataStore:
         Returns:
             Row ID
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 """
                 INSERT INTO oracle_updates
@@ -300,13 +622,42 @@ class DataStore:
             )
             return cursor.lastrowid
 
+    async def log_oracle_updates_batch(
+        self,
+        updates: List[Tuple[str, Optional[str], Optional[int], Optional[int], str, Optional[str]]]
+    ) -> None:
+        """
+        Log several oracle update attempts in one transaction.
+
+        Args:
+            updates: (rate_type, tx_hash, block_number, gas_used, status,
+                error_message) tuples, as in log_oracle_update
+        """
+        if not updates:
+            return
+
+        async with self._acquire() as db:
+            await db.executemany(
+                """
+                INSERT INTO oracle_updates
+                (rate_type, tx_hash, block_number, gas_used, status, error_message)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                updates
+            )
+            await db.commit()
+            logger.info(
+                f"Logged {len(updates)} oracle updates",
+                extra={"rate_types": [u[0] for u in updates], "tx_hash": updates[0][1]}
+            )
+
     async def get_oracle_updates(
         self,
         rate_type: Optional[str] = None,
         limit: int = 100
     ) -> List[OracleUpdate]:
         """Get recent oracle update records."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             db.row_factory = aiosqlite.Row
 
             if rate_type:
@@ -373,7 +724,7 @@ class DataStore:
         Returns:
             Row ID
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 """
                 INSERT INTO anomalies
@@ -391,6 +742,50 @@ class DataStore:
             )
             return cursor.lastrowid
 
+    async def log_anomalies_batch(
+        self,
+        anomalies: List[Tuple[str, str, float, float, float, float, str]]
+    ) -> None:
+        """
+        Log several detected anomalies in one transaction.
+
+        Args:
+            anomalies: (rate_type, anomaly_type, current_value, expected_low,
+                expected_high, std_devs, message) tuples, as in log_anomaly
+        """
+        if not anomalies:
+            return
+
+        async with self._acquire() as db:
+            await self._insert_anomalies(db, anomalies)
+            await db.commit()
+        self._log_anomalies(anomalies)
+
+    @staticmethod
+    async def _insert_anomalies(
+        db: aiosqlite.Connection,
+        anomalies: List[Tuple[str, str, float, float, float, float, str]]
+    ) -> None:
+        """INSERT anomalies rows (caller commits)."""
+        await db.executemany(
+            """
+            INSERT INTO anomalies
+            (rate_type, anomaly_type, current_value, expected_range_low,
+             expected_range_high, std_devs, message)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            anomalies
+        )
+
+    @staticmethod
+    def _log_anomalies(anomalies: List[Tuple[str, str, float, float, float, float, str]]) -> None:
+        """Log committed anomaly tuples."""
+        for anomaly in anomalies:
+            logger.warning(
+                f"Anomaly logged: {anomaly[0]} - {anomaly[1]}: {anomaly[6]}",
+                extra={"rate_type": anomaly[0], "anomaly_type": anomaly[1], "z_score": anomaly[5]}
+            )
+
     async def get_anomalies(
         self,
         rate_type: Optional[str] = None,
@@ -400,7 +795,7 @@ class DataStore:
         """Get recent anomaly records."""
         cutoff = datetime.now() - timedelta(days=days)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             db.row_factory = aiosqlite.Row
 
             if rate_type:
@@ -461,7 +856,7 @@ class DataStore:
         Returns:
             Row ID for updating later
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 """
                 INSERT INTO scheduler_runs (job_id, started_at, status)
@@ -494,7 +889,7 @@ class DataStore:
             rates_updated: Number of rates updated
             error_message: Error details if failed
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 """
                 UPDATE scheduler_runs
@@ -509,9 +904,51 @@ class DataStore:
             )
             await db.commit()
 
+    async def record_scheduler_run(
+        self,
+        job_id: str,
+        started_at: datetime,
+        ended_at: datetime,
+        status: str,
+        rates_processed: int = 0,
+        rates_updated: int = 0,
+        error_message: Optional[str] = None
+    ) -> int:
+        """
+        Record a finished scheduler run in a single write.
+
+        Replaces the log_scheduler_run/update_scheduler_run pair for callers
+        that track in-progress runs in memory.
+
+        Args:
+            job_id: Job identifier
+            started_at: Job start time
+            ended_at: Job completion time
+            status: Final status ('completed', 'failed')
+            rates_processed: Number of rates processed
+            rates_updated: Number of rates updated
+            error_message: Error details if failed
+
+        Returns:
+            Row ID of the run
+        """
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                """
+                INSERT INTO scheduler_runs
+                (job_id, started_at, ended_at, status, rates_processed,
+                 rates_updated, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, started_at.isoformat(), ended_at.isoformat(), status,
+                 rates_processed, rates_updated, error_message)
+            )
+            await db.commit()
+            return cursor.lastrowid
+
     async def get_scheduler_runs(self, limit: int = 20) -> List[SchedulerRun]:
         """Get recent scheduler job runs."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """
@@ -537,23 +974,100 @@ class DataStore:
                 for row in rows
             ]
 
+    # =========================================================================
+    # SYNC JOBS
+    # =========================================================================
+
+    async def create_sync_job(self, rate_types: List[str]) -> int:
+        """
+        Record a pending manual sync job.
+
+        Args:
+            rate_types: Rate types the job will sync
+
+        Returns:
+            Job ID for polling and completion
+        """
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                """
+                INSERT INTO sync_jobs (rate_types, status, created_at)
+                VALUES (?, 'pending', ?)
+                """,
+                (",".join(rate_types), datetime.now().isoformat())
+            )
+            await db.commit()
+            return cursor.lastrowid
+
+    async def complete_sync_job(self, job_id: int, results: Dict[str, Any]) -> None:
+        """
+        Record the outcome of a manual sync job.
+
+        Args:
+            job_id: Job ID from create_sync_job
+            results: Result dictionary from RateScheduler._update_rates
+        """
+        async with self._acquire() as db:
+            await db.execute(
+                """
+                UPDATE sync_jobs
+                SET status = ?, completed_at = ?, rates_updated = ?, rates_skipped = ?,
+                    rates_failed = ?, anomalies_detected = ?, tx_hash = ?, error_message = ?
+                WHERE id = ?
+                """,
+                (
+                    "completed" if results.get("success") else "failed",
+                    datetime.now().isoformat(),
+                    results.get("rates_updated", 0),
+                    results.get("rates_skipped", 0),
+                    results.get("rates_failed", 0),
+                    results.get("anomalies_detected", 0),
+                    results.get("tx_hash"),
+                    results.get("error"),
+                    job_id,
+                )
+            )
+            await db.commit()
+
+    async def get_sync_job(self, job_id: int) -> Optional[SyncJob]:
+        """Get a manual sync job by ID."""
+        async with self._acquire() as db:
+            db.row_factory = aiosqlite.Row
+            cursor = await db.execute("SELECT * FROM sync_jobs WHERE id = ?", (job_id,))
+            row = await cursor.fetchone()
+
+            if row is None:
+                return None
+
+            return SyncJob(
+                id=row["id"],
+                rate_types=row["rate_types"].split(","),
+                status=row["status"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
+                rates_updated=row["rates_updated"],
+                rates_skipped=row["rates_skipped"],
+                rates_failed=row["rates_failed"],
+                anomalies_detected=row["anomalies_detected"],
+                tx_hash=row["tx_hash"],
+                error_message=row["error_message"],
+            )
+
     # =========================================================================
     # STATISTICS
     # =========================================================================
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Count records in each table
-            rates_count = await db.execute("SELECT COUNT(*) FROM rates")
-            updates_count = await db.execute("SELECT COUNT(*) FROM oracle_updates")
-            anomalies_count = await db.execute("SELECT COUNT(*) FROM anomalies")
-            runs_count = await db.execute("SELECT COUNT(*) FROM scheduler_runs")
+        async with self._acquire() as db:
+            # Count records in each table in a single round trip
+            cursor = await db.execute(STATS_SQL)
+            rates_count, updates_count, anomalies_count, runs_count = await cursor.fetchone()
 
             return {
-                "rates_count": (await rates_count.fetchone())[0],
-                "oracle_updates_count": (await updates_count.fetchone())[0],
-                "anomalies_count": (await anomalies_count.fetchone())[0],
-                "scheduler_runs_count": (await runs_count.fetchone())[0],
+                "rates_count": rates_count,
+                "oracle_updates_count": updates_count,
+                "anomalies_count": anomalies_count,
+                "scheduler_runs_count": runs_count,
                 "database_path": str(self.db_path),
             }
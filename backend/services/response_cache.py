@@ -0,0 +1,72 @@
+"""
+DELOS Response Cache
+In-process TTL cache for API responses backed by on-chain or stored data.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Namespaced in-memory cache with per-entry TTL.
+
+    Oracle and history data only change on the scheduler's update cadence,
+    so API handlers can serve repeated requests from memory. Whole
+    namespaces are cleared when the underlying data changes (e.g. after
+    a manual sync).
+
+    Usage:
+        cache = ResponseCache()
+        cache.set("rates", "all", payload, ttl=60)
+        payload = cache.get("rates", "all")  # None once expired
+        cache.clear("rates")
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[Hashable, Tuple[float, Any]]] = {}
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Cache namespace (e.g., "rates")
+            key: Entry key within the namespace
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(namespace, {}).get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[namespace][key]
+            return None
+        return value
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Store a value.
+
+        Args:
+            namespace: Cache namespace
+            key: Entry key within the namespace
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        self._entries.setdefault(namespace, {})[key] = (time.monotonic() + ttl, value)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            namespace: Namespace to clear (default: all namespaces)
+        """
+        if namespace is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(namespace, None)
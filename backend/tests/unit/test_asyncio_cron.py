@@ -0,0 +1,139 @@
+"""
+Tests for services.asyncio_cron.CronTrigger.
+
+Covers the expressions the scheduler's jobs use: weekday ranges (daily
+update), day-of-month (monthly update) and */N steps (stale check).
+"""
+
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from services.asyncio_cron import CronTrigger, _parse_field
+
+BRT = ZoneInfo("America/Sao_Paulo")
+
+
+def brt(year, month, day, hour=0, minute=0):
+    return datetime(year, month, day, hour, minute, tzinfo=BRT)
+
+
+# =============================================================================
+# Field parsing
+# =============================================================================
+
+@pytest.mark.parametrize("value, expected", [
+    (None, set(range(0, 24))),
+    (5, {5}),
+    ("*", set(range(0, 24))),
+    ("7", {7}),
+    ("1-3", {1, 2, 3}),
+    ("*/4", {0, 4, 8, 12, 16, 20}),
+    ("2-10/3", {2, 5, 8}),
+    ("1,5,9-10", {1, 5, 9, 10}),
+])
+def test_parse_field(value, expected):
+    assert _parse_field(value, 0, 23) == expected
+
+
+def test_parse_field_weekday_names():
+    names = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+    assert _parse_field("mon-fri", 0, 6, names) == {0, 1, 2, 3, 4}
+    assert _parse_field("SAT,sun", 0, 6, names) == {5, 6}
+
+
+@pytest.mark.parametrize("value", ["24", "0-30", "*/0", "abc"])
+def test_parse_field_rejects_invalid(value):
+    with pytest.raises(ValueError):
+        _parse_field(value, 0, 23)
+
+
+# =============================================================================
+# Weekdays (daily update: 19:00 BRT, mon-fri)
+# =============================================================================
+
+DAILY = CronTrigger(hour=19, minute=0, day_of_week="mon-fri", timezone=BRT)
+
+
+def test_weekday_later_same_day():
+    # Wednesday morning -> Wednesday 19:00
+    assert DAILY.get_next_fire_time(brt(2026, 10, 14, 10, 0)) == brt(2026, 10, 14, 19, 0)
+
+
+def test_weekday_fire_time_is_strictly_after_now():
+    # Exactly at Wednesday's fire time -> Thursday's
+    assert DAILY.get_next_fire_time(brt(2026, 10, 14, 19, 0)) == brt(2026, 10, 15, 19, 0)
+
+
+@pytest.mark.parametrize("now", [
+    brt(2026, 10, 16, 19, 0),   # Friday after the run
+    brt(2026, 10, 17, 12, 0),   # Saturday
+    brt(2026, 10, 18, 23, 59),  # Sunday night
+])
+def test_weekday_skips_weekend(now):
+    assert DAILY.get_next_fire_time(now) == brt(2026, 10, 19, 19, 0)  # Monday
+
+
+def test_converts_reference_time_to_trigger_timezone():
+    # 21:30 UTC Wednesday is 18:30 BRT -> fires at 19:00 BRT that day
+    now = datetime(2026, 10, 14, 21, 30, tzinfo=timezone.utc)
+    assert DAILY.get_next_fire_time(now) == brt(2026, 10, 14, 19, 0)
+
+
+# =============================================================================
+# Day of month (monthly update: day N, 10:00 BRT)
+# =============================================================================
+
+def test_day_of_month_next_month():
+    monthly = CronTrigger(day=15, hour=10, minute=0, timezone=BRT)
+    assert monthly.get_next_fire_time(brt(2026, 10, 15, 10, 0)) == brt(2026, 11, 15, 10, 0)
+
+
+def test_day_of_month_same_day():
+    monthly = CronTrigger(day=15, hour=10, minute=0, timezone=BRT)
+    assert monthly.get_next_fire_time(brt(2026, 10, 15, 9, 59)) == brt(2026, 10, 15, 10, 0)
+
+
+def test_day_of_month_crosses_year():
+    monthly = CronTrigger(day=1, hour=10, minute=0, timezone=BRT)
+    assert monthly.get_next_fire_time(brt(2026, 12, 2)) == brt(2027, 1, 1, 10, 0)
+
+
+def test_day_of_month_skips_short_months():
+    monthly = CronTrigger(day=31, hour=10, minute=0, timezone=BRT)
+    assert monthly.get_next_fire_time(brt(2026, 1, 31, 11, 0)) == brt(2026, 3, 31, 10, 0)
+
+
+# =============================================================================
+# Steps (stale check: every 4 hours on the hour)
+# =============================================================================
+
+STALE = CronTrigger(hour="*/4", timezone=BRT)
+
+
+def test_step_next_slot():
+    assert STALE.get_next_fire_time(brt(2026, 10, 14, 5, 30)) == brt(2026, 10, 14, 8, 0)
+
+
+def test_step_on_slot_moves_to_next():
+    assert STALE.get_next_fire_time(brt(2026, 10, 14, 8, 0)) == brt(2026, 10, 14, 12, 0)
+
+
+def test_step_wraps_to_next_day():
+    assert STALE.get_next_fire_time(brt(2026, 10, 14, 20, 1)) == brt(2026, 10, 15, 0, 0)
+
+
+def test_minute_step():
+    trigger = CronTrigger(minute="*/15", timezone=BRT)
+    assert trigger.get_next_fire_time(brt(2026, 10, 14, 9, 46)) == brt(2026, 10, 14, 10, 0)
+    assert trigger.get_next_fire_time(brt(2026, 10, 14, 9, 14)) == brt(2026, 10, 14, 9, 15)
+
+
+def test_seconds_are_ignored():
+    now = datetime(2026, 10, 14, 7, 59, 59, 999999, tzinfo=BRT)
+    assert STALE.get_next_fire_time(now) == brt(2026, 10, 14, 8, 0)
+
+
+def test_str():
+    assert str(DAILY) == "cron[day_of_week='mon-fri', hour='19', minute='0']"
@@ -0,0 +1,54 @@
+"""
+Tests for BCBClient value parsing.
+"""
+
+import asyncio
+
+import pytest
+
+from bcb_client import BCBClient, RateType
+
+
+@pytest.fixture
+def client():
+    return BCBClient()
+
+
+@pytest.mark.parametrize("value, scaled", [
+    ("10.90", 1_090_000_000),
+    ("5,8123", 581_230_000),
+    ("15", 1_500_000_000),
+    ("0.00000001", 1),
+    ("1.5 ", 150_000_000),
+    (" 1.5\n", 150_000_000),
+    ("1,5 ", 150_000_000),
+    ("-0.5", -50_000_000),
+    ("-1,25", -125_000_000),
+    ("+2.5", 250_000_000),
+])
+def test_parse_decimal_string(client, value, scaled):
+    assert client._parse_bcb_decimal(value) == (scaled, scaled / 10**8)
+
+
+@pytest.mark.parametrize("value", ["1.5_0", "1_000.5", "1e-3", "0.123456789", 10.9, 4])
+def test_parse_falls_back_to_float(client, value):
+    expected = float(value.replace(",", ".")) if isinstance(value, str) else float(value)
+    scaled, raw = client._parse_bcb_decimal(value)
+    assert raw == expected
+    assert scaled == round(expected * 10**8)
+
+
+@pytest.mark.parametrize("value", ["", " ", "-", ".", "abc", "1.5.0"])
+def test_parse_rejects_non_numbers(client, value):
+    with pytest.raises(ValueError):
+        client._parse_bcb_decimal(value)
+
+
+async def _fetch_latest(rate_type):
+    return rate_type
+
+
+def test_fetch_with_retry_is_deprecated_alias(client, monkeypatch):
+    monkeypatch.setattr(client, "fetch_latest", _fetch_latest)
+    with pytest.warns(DeprecationWarning):
+        assert asyncio.run(client.fetch_with_retry(RateType.CDI)) is RateType.CDI